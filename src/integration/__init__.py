@@ -7,12 +7,24 @@ This module provides client implementations for integrating with external servic
 - Infrastructure services (PostgreSQL, Redis)
 """
 
-from .base import ServiceClient, ServiceError, ServiceTimeout, ServiceConnectionError
+from .base import (
+    ServiceClient,
+    ServiceError,
+    ServiceTimeout,
+    ServiceConnectionError,
+    LazySession,
+    enable_uvloop,
+)
 from .indexagent_client import IndexAgentClient
 from .airflow_client import AirflowClient
 from .infra_client import EvolutionAPIClient, InfrastructureClient
 from .service_adapters import ServicePool, create_service_pool
-from .auth_base import AuthenticatedServiceClient, TokenManager
+from .auth_base import (
+    AuthenticatedServiceClient,
+    ServiceToken,
+    TokenManager,
+    bearer_token_override,
+)
 from .auth_service_pool import AuthenticatedServicePool, create_authenticated_service_pool
 
 __all__ = [
@@ -20,6 +32,8 @@ __all__ = [
     "ServiceError", 
     "ServiceTimeout",
     "ServiceConnectionError",
+    "LazySession",
+    "enable_uvloop",
     "IndexAgentClient",
     "AirflowClient",
     "EvolutionAPIClient",
@@ -29,6 +43,8 @@ __all__ = [
     # Authentication-aware versions
     "AuthenticatedServiceClient",
     "TokenManager",
+    "ServiceToken",
+    "bearer_token_override",
     "AuthenticatedServicePool",
     "create_authenticated_service_pool",
 ]
\ No newline at end of file
@@ -1,9 +1,26 @@
 """Airflow API client implementation."""
 
-import base64
-from typing import Any, Dict, List, Optional
-from datetime import datetime
-from .base import ServiceClient
+import asyncio
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from datetime import datetime, timezone
+import aiohttp
+import orjson
+from cachetools import TTLCache
+from .base import ServiceClient, ServiceTimeout
+
+# orjson options for request bodies: naive datetimes are treated as UTC
+# (Airflow's convention) and numpy values in DAG ``conf`` are encoded natively.
+_JSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    """Serialize a request payload to JSON bytes."""
+    return orjson.dumps(payload, option=_JSON_OPTIONS)
+
+
+# Pre-encoded bodies for the DAG pause toggle
+_PAUSE_BODY = _dumps({"is_paused": True})
+_UNPAUSE_BODY = _dumps({"is_paused": False})
 
 
 class AirflowClient(ServiceClient):
@@ -13,6 +30,10 @@ class AirflowClient(ServiceClient):
     - DAG management (list, get, pause/unpause)
     - DAG execution (trigger, monitor)
     - Task information retrieval
+    
+    Status polling (``wait_for_dag_completion``) and concurrent triggers are
+    event-loop bound; processes driving this client should call
+    ``enable_uvloop()`` before starting their event loop.
     """
     
     def __init__(
@@ -20,6 +41,7 @@ class AirflowClient(ServiceClient):
         base_url: str = "http://localhost:8080",
         username: str = "airflow",
         password: str = "airflow",
+        metadata_cache_ttl: float = 30.0,
         **kwargs
     ):
         """Initialize Airflow client.
@@ -28,16 +50,17 @@ class AirflowClient(ServiceClient):
             base_url: Airflow API base URL
             username: Airflow username for basic auth
             password: Airflow password for basic auth
+            metadata_cache_ttl: Seconds to cache DAG and task definitions
             **kwargs: Additional arguments for ServiceClient
         """
         super().__init__(base_url, "Airflow", **kwargs)
         
+        # DAG/task definitions change rarely; cache them briefly
+        self._metadata_cache: TTLCache = TTLCache(maxsize=1024, ttl=metadata_cache_ttl)
+        self._metadata_locks: Dict[Tuple[str, ...], asyncio.Lock] = {}
+        
         # Configure basic authentication
-        credentials = f"{username}:{password}"
-        encoded_credentials = base64.b64encode(credentials.encode()).decode()
-        self._session.headers.update({
-            'Authorization': f'Basic {encoded_credentials}'
-        })
+        self.auth = aiohttp.BasicAuth(username, password)
         
         # API base path
         self.api_base = "/api/v1"
@@ -50,6 +73,27 @@ class AirflowClient(ServiceClient):
         """
         return await self.get(f"{self.api_base}/health")
     
+    async def _get_cached(self, key: Tuple[str, ...], endpoint: str) -> Dict[str, Any]:
+        """GET an endpoint through the metadata TTL cache.
+        
+        Concurrent misses for the same key share one request.
+        """
+        try:
+            return self._metadata_cache[key]
+        except KeyError:
+            pass
+        
+        lock = self._metadata_locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                if key in self._metadata_cache:
+                    return self._metadata_cache[key]
+                result = await self.get(endpoint)
+                self._metadata_cache[key] = result
+                return result
+        finally:
+            self._metadata_locks.pop(key, None)
+    
     # DAG Management
     
     async def list_dags(
@@ -89,7 +133,7 @@ class AirflowClient(ServiceClient):
         Returns:
             DAG configuration and metadata
         """
-        return await self.get(f"{self.api_base}/dags/{dag_id}")
+        return await self._get_cached(("dag", dag_id), f"{self.api_base}/dags/{dag_id}")
     
     async def update_dag(self, dag_id: str, is_paused: bool) -> Dict[str, Any]:
         """Update DAG state (pause/unpause).
@@ -101,8 +145,7 @@ class AirflowClient(ServiceClient):
         Returns:
             Updated DAG details
         """
-        payload = {"is_paused": is_paused}
-        return await self.patch(f"{self.api_base}/dags/{dag_id}", json=payload)
+        return await self._patch_dag(dag_id, _PAUSE_BODY if is_paused else _UNPAUSE_BODY)
     
     async def pause_dag(self, dag_id: str) -> Dict[str, Any]:
         """Pause a DAG.
@@ -113,7 +156,7 @@ class AirflowClient(ServiceClient):
         Returns:
             Updated DAG details
         """
-        return await self.update_dag(dag_id, is_paused=True)
+        return await self._patch_dag(dag_id, _PAUSE_BODY)
     
     async def unpause_dag(self, dag_id: str) -> Dict[str, Any]:
         """Unpause a DAG.
@@ -124,7 +167,15 @@ class AirflowClient(ServiceClient):
         Returns:
             Updated DAG details
         """
-        return await self.update_dag(dag_id, is_paused=False)
+        return await self._patch_dag(dag_id, _UNPAUSE_BODY)
+    
+    async def _patch_dag(self, dag_id: str, body: bytes) -> Dict[str, Any]:
+        """PATCH a DAG with a pre-encoded body and drop its cached definition."""
+        try:
+            return await self.patch(f"{self.api_base}/dags/{dag_id}", data=body)
+        finally:
+            # After the write, so a read racing it cannot re-cache the old state
+            self._metadata_cache.pop(("dag", dag_id), None)
     
     # DAG Execution
     
@@ -147,18 +198,23 @@ class AirflowClient(ServiceClient):
             DAG run details including run_id
         """
         if execution_date is None:
-            execution_date = datetime.utcnow()
-            
+            execution_date = datetime.now(timezone.utc)
+        
+        # Format once; the first 19 characters are the seconds-resolution stamp
+        execution_iso = execution_date.isoformat()
         if run_id is None:
-            run_id = f"manual__{execution_date.strftime('%Y-%m-%dT%H:%M:%S')}"
+            run_id = f"manual__{execution_iso[:19]}"
         
         payload = {
             "conf": conf or {},
             "dag_run_id": run_id,
-            "execution_date": execution_date.isoformat(),
+            "execution_date": execution_iso,
         }
         
-        return await self.post(f"{self.api_base}/dags/{dag_id}/dagRuns", json=payload)
+        return await self.post(
+            f"{self.api_base}/dags/{dag_id}/dagRuns",
+            data=_dumps(payload)
+        )
     
     async def get_dag_run(self, dag_id: str, dag_run_id: str) -> Dict[str, Any]:
         """Get status of a specific DAG run.
@@ -199,6 +255,33 @@ class AirflowClient(ServiceClient):
             
         return await self.get(f"{self.api_base}/dags/{dag_id}/dagRuns", params=params)
     
+    async def list_dag_runs_many(
+        self,
+        dag_ids: Sequence[str],
+        limit: int = 25,
+        offset: int = 0,
+        state: Optional[List[str]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """List DAG runs for several DAGs concurrently.
+        
+        Requests are issued together over the client's pooled keep-alive
+        connections instead of one after another.
+        
+        Args:
+            dag_ids: DAG identifiers
+            limit: Maximum number of runs to return per DAG
+            offset: Number of runs to skip per DAG
+            state: Filter by run states (success, failed, running)
+            
+        Returns:
+            Mapping of DAG ID to its paginated list of DAG runs
+        """
+        results = await asyncio.gather(*(
+            self.list_dag_runs(dag_id, limit=limit, offset=offset, state=state)
+            for dag_id in dag_ids
+        ))
+        return dict(zip(dag_ids, results))
+    
     async def cancel_dag_run(self, dag_id: str, dag_run_id: str) -> Dict[str, Any]:
         """Cancel a running DAG.
         
@@ -212,7 +295,7 @@ class AirflowClient(ServiceClient):
         payload = {"state": "failed"}
         return await self.patch(
             f"{self.api_base}/dags/{dag_id}/dagRuns/{dag_run_id}",
-            json=payload
+            data=_dumps(payload)
         )
     
     # Task Information
@@ -238,7 +321,10 @@ class AirflowClient(ServiceClient):
         Returns:
             Task configuration and metadata
         """
-        return await self.get(f"{self.api_base}/dags/{dag_id}/tasks/{task_id}")
+        return await self._get_cached(
+            ("task", dag_id, task_id),
+            f"{self.api_base}/dags/{dag_id}/tasks/{task_id}"
+        )
     
     async def get_task_instances(
         self,
@@ -267,6 +353,27 @@ class AirflowClient(ServiceClient):
             params=params
         )
     
+    async def get_task_instances_many(
+        self,
+        dag_runs: Sequence[Tuple[str, str]],
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """Get task instances for several DAG runs concurrently.
+        
+        Args:
+            dag_runs: Sequence of (dag_id, dag_run_id) pairs
+            limit: Maximum number of instances to return per run
+            offset: Number of instances to skip per run
+            
+        Returns:
+            Task instance listings in the same order as ``dag_runs``
+        """
+        return list(await asyncio.gather(*(
+            self.get_task_instances(dag_id, dag_run_id, limit=limit, offset=offset)
+            for dag_id, dag_run_id in dag_runs
+        )))
+    
     async def get_task_instance(
         self,
         dag_id: str,
@@ -310,9 +417,6 @@ class AirflowClient(ServiceClient):
         Raises:
             ServiceTimeout: If DAG doesn't complete within timeout
         """
-        import asyncio
-        from .base import ServiceTimeout
-        
         start_time = datetime.utcnow()
         
         while True:
@@ -5,9 +5,16 @@ Extends the base service client with JWT and API key authentication support.
 """
 
 import asyncio
-from typing import Optional, Dict, Any, Union
-from datetime import datetime, timedelta
+import hashlib
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, AsyncIterator, Iterator, List, Literal, Union
+import aiohttp
 import structlog
+from cachetools import TTLCache
+from jose import JWTError, jwt
 
 from .base import ServiceClient, ServiceError
 from ..auth import TokenResponse, TokenRefreshRequest, get_auth_manager
@@ -15,6 +22,80 @@ from ..auth import TokenResponse, TokenRefreshRequest, get_auth_manager
 # Configure logging
 logger = structlog.get_logger(__name__)
 
+AuthMode = Literal["bearer", "apikey", "none"]
+
+# Header carrying the credential for each auth mode
+_AUTH_HEADERS: Dict[str, str] = {
+    "bearer": "Authorization",
+    "apikey": "X-API-Key",
+}
+
+# Bearer token overriding client credentials for requests made in the
+# current context (impersonation, tests); see ``bearer_token_override``
+_AUTH_TOKEN: ContextVar[Optional[str]] = ContextVar("dean_auth", default=None)
+
+
+@contextmanager
+def bearer_token_override(token: str) -> Iterator[None]:
+    """Send ``token`` instead of the clients' own credentials.
+    
+    Applies to authenticated requests made in the current context,
+    including tasks it spawns, until the block exits.
+    
+    Args:
+        token: Bearer token to send
+    """
+    reset_token = _AUTH_TOKEN.set(token)
+    try:
+        yield
+    finally:
+        _AUTH_TOKEN.reset(reset_token)
+
+
+def _with_bearer(kwargs: Dict[str, Any], token: str) -> Dict[str, Any]:
+    """Return request kwargs carrying ``token`` as the Authorization header."""
+    headers = kwargs.get('headers')
+    authorization = {"Authorization": f"Bearer {token}"}
+    return {**kwargs, 'headers': {**headers, **authorization} if headers else authorization}
+
+
+# Unverified JWT claims keyed by a digest of the token, shared process-wide so
+# clients handed the same token decode it once
+_token_claims_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+
+
+def _token_key(token: str) -> bytes:
+    """Cache key for a bearer token (never store the raw token)."""
+    return hashlib.sha256(token.encode()).digest()[:16]
+
+
+def get_cached_token_claims(token: str) -> Dict[str, Any]:
+    """Return the token's JWT claims without verifying the signature.
+    
+    Claims are only used client-side to schedule refreshes; the issuing
+    service remains responsible for verification.
+    
+    Args:
+        token: Bearer token
+        
+    Returns:
+        Claims dictionary (empty if the token is not a JWT)
+    """
+    key = _token_key(token)
+    claims = _token_claims_cache.get(key)
+    if claims is None:
+        try:
+            claims = jwt.get_unverified_claims(token)
+        except JWTError:
+            claims = {}
+        _token_claims_cache[key] = claims
+    return claims
+
+
+def evict_cached_token_claims(token: str) -> None:
+    """Drop a token's cached claims (e.g. after the service rejected it)."""
+    _token_claims_cache.pop(_token_key(token), None)
+
 
 class AuthenticationError(ServiceError):
     """Raised when authentication fails."""
@@ -37,7 +118,8 @@ class AuthenticatedServiceClient(ServiceClient):
         service_name: str,
         timeout: int = 30,
         max_retries: int = 3,
-        pool_size: int = 10,
+        pool_size: Optional[int] = None,
+        session: Optional[aiohttp.ClientSession] = None,
         # Authentication parameters
         auth_token: Optional[str] = None,
         refresh_token: Optional[str] = None,
@@ -53,46 +135,77 @@ class AuthenticatedServiceClient(ServiceClient):
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
             pool_size: Connection pool size
+            session: Shared HTTP session (see ServiceClient)
             auth_token: JWT access token
             refresh_token: JWT refresh token
             api_key: API key for fallback authentication
             auth_endpoint: URL for token refresh (if different from base)
             auto_refresh: Automatically refresh expired tokens
         """
-        super().__init__(base_url, service_name, timeout, max_retries, pool_size)
+        super().__init__(base_url, service_name, timeout, max_retries, pool_size, session)
         
         self.auth_token = auth_token
         self.refresh_token = refresh_token
         self.api_key = api_key
         self.auth_endpoint = auth_endpoint or base_url
         self.auto_refresh = auto_refresh
-        self.token_expires_at: Optional[datetime] = None
+        # Expiry on the time.monotonic() clock
+        self.token_expires_at: Optional[float] = None
+        
+        # In-flight refresh shared by concurrent callers
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refresh_lock = asyncio.Lock()
+        
+        # Auth header state currently applied to the client headers
+        self._auth_mode: AuthMode = "none"
+        self._auth_value: Optional[str] = None
         
         # Update session headers with authentication
         self._update_auth_headers()
         
     def _update_auth_headers(self):
-        """Update session headers with current authentication."""
+        """Update client headers with current authentication.
+        
+        Headers are only touched when the credential actually changes; the
+        previous mode's header is removed on a mode transition.
+        """
+        mode: AuthMode
         if self.auth_token:
-            self._session.headers['Authorization'] = f'Bearer {self.auth_token}'
+            mode, value = "bearer", f"Bearer {self.auth_token}"
         elif self.api_key:
-            self._session.headers['X-API-Key'] = self.api_key
+            mode, value = "apikey", self.api_key
         else:
-            # Remove auth headers if no credentials
-            self._session.headers.pop('Authorization', None)
-            self._session.headers.pop('X-API-Key', None)
+            mode, value = "none", None
+        
+        if mode == self._auth_mode and value == self._auth_value:
+            return
+        
+        headers = self.headers
+        if mode != self._auth_mode and self._auth_mode != "none":
+            headers.pop(_AUTH_HEADERS[self._auth_mode], None)
+        if mode != "none":
+            headers[_AUTH_HEADERS[mode]] = value
+        
+        self._auth_mode = mode
+        self._auth_value = value
     
     async def set_auth_token(self, token: str, expires_in: Optional[int] = None):
         """Set the authentication token.
         
         Args:
             token: JWT access token
-            expires_in: Token expiration time in seconds
+            expires_in: Token expiration time in seconds (read from the
+                token's ``exp`` claim when not given)
         """
         self.auth_token = token
         
+        if not expires_in:
+            exp = get_cached_token_claims(token).get("exp")
+            if isinstance(exp, (int, float)):
+                expires_in = max(exp - time.time(), 0) or None
+        
         if expires_in:
-            self.token_expires_at = datetime.utcnow() + timedelta(seconds=expires_in)
+            self.token_expires_at = time.monotonic() + expires_in
         else:
             self.token_expires_at = None
             
@@ -118,9 +231,20 @@ class AuthenticatedServiceClient(ServiceClient):
     async def refresh_auth_token(self) -> bool:
         """Refresh the authentication token.
         
+        Concurrent callers share a single in-flight refresh, so a burst of
+        401 responses results in one call to the auth endpoint.
+        
         Returns:
             True if refresh successful, False otherwise
         """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_auth_token())
+        
+        # Shield so a cancelled caller does not abort the refresh for others
+        return await asyncio.shield(self._refresh_task)
+    
+    async def _refresh_auth_token(self) -> bool:
+        """Perform a single token refresh against the auth endpoint."""
         if not self.refresh_token:
             self.logger.warning("no_refresh_token_available")
             return False
@@ -130,13 +254,16 @@ class AuthenticatedServiceClient(ServiceClient):
             refresh_request = TokenRefreshRequest(refresh_token=self.refresh_token)
             
             # Call auth endpoint
-            async with self._session.post(
+            session = await self._get_session()
+            async with session.post(
                 f"{self.auth_endpoint}/auth/refresh",
                 json=refresh_request.dict()
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    token_response = TokenResponse(**data)
+                    # Parse and validate in one pass with pydantic-core's JSON parser
+                    token_response = TokenResponse.model_validate_json(
+                        await response.read()
+                    )
                     
                     # Update tokens
                     self.auth_token = token_response.access_token
@@ -175,8 +302,21 @@ class AuthenticatedServiceClient(ServiceClient):
             return False
             
         # Refresh if token expires in less than 5 minutes
-        time_until_expiry = self.token_expires_at - datetime.utcnow()
-        return time_until_expiry.total_seconds() < 300
+        return self.token_expires_at - time.monotonic() < 300
+    
+    async def _ensure_token(self):
+        """Refresh the token ahead of a request if it is about to expire.
+        
+        The expiry check runs without the lock on the fast path and is
+        repeated under it, so waiters skip a refresh another coroutine has
+        just completed.
+        """
+        if not self._should_refresh_token():
+            return
+        
+        async with self._refresh_lock:
+            if self._should_refresh_token():
+                await self.refresh_auth_token()
     
     async def _request(
         self,
@@ -190,22 +330,29 @@ class AuthenticatedServiceClient(ServiceClient):
         - Automatic token refresh
         - 401 response handling
         - Fallback to API key
+        - Per-context token override (``bearer_token_override``)
         """
-        # Check if token needs refresh
-        if self._should_refresh_token():
-            await self.refresh_auth_token()
+        override = _AUTH_TOKEN.get()
+        if override is not None:
+            return await super()._request(method, endpoint, **_with_bearer(kwargs, override))
+        
+        await self._ensure_token()
         
         # First attempt
         try:
             return await super()._request(method, endpoint, **kwargs)
         except ServiceError as e:
             # Check if it's an authentication error
-            if hasattr(e, 'details') and e.details.get('status') == 401:
+            if e.details.get('status_code') == 401:
                 self.logger.warning(
                     "authentication_failed",
                     endpoint=endpoint
                 )
                 
+                # The service rejected this token; forget what we decoded
+                if self.auth_token:
+                    evict_cached_token_claims(self.auth_token)
+                
                 # Try to refresh token if we have a refresh token
                 if self.refresh_token and await self.refresh_auth_token():
                     # Retry request with new token
@@ -222,6 +369,23 @@ class AuthenticatedServiceClient(ServiceClient):
                 # Re-raise non-auth errors
                 raise
     
+    async def _request_iter(
+        self,
+        method: str,
+        endpoint: str,
+        json_path: str = "item",
+        **kwargs
+    ) -> AsyncIterator[Any]:
+        """Stream a response after making sure the token is fresh."""
+        override = _AUTH_TOKEN.get()
+        if override is not None:
+            kwargs = _with_bearer(kwargs, override)
+        else:
+            await self._ensure_token()
+        
+        async for item in super()._request_iter(method, endpoint, json_path, **kwargs):
+            yield item
+    
     async def authenticate_with_credentials(
         self,
         username: str,
@@ -237,14 +401,16 @@ class AuthenticatedServiceClient(ServiceClient):
             True if authentication successful
         """
         try:
-            response = await self._session.post(
+            session = await self._get_session()
+            response = await session.post(
                 f"{self.auth_endpoint}/auth/login",
                 json={"username": username, "password": password}
             )
             
             if response.status == 200:
-                data = await response.json()
-                token_response = TokenResponse(**data)
+                token_response = TokenResponse.model_validate_json(
+                    await response.read()
+                )
                 
                 # Store tokens
                 self.auth_token = token_response.access_token
@@ -276,6 +442,20 @@ class AuthenticatedServiceClient(ServiceClient):
             return False
 
 
+@dataclass(slots=True)
+class ServiceToken:
+    """Token pair held by the TokenManager for one service.
+    
+    ``expires_at`` is measured on the ``time.monotonic()`` clock.
+    """
+    access_token: str
+    refresh_token: str
+    expires_at: float
+    user_id: Optional[str] = None
+    username: Optional[str] = None
+    roles: Optional[List[str]] = None
+
+
 class TokenManager:
     """Manages authentication tokens for multiple services.
     
@@ -287,7 +467,7 @@ class TokenManager:
     
     def __init__(self):
         """Initialize token manager."""
-        self.tokens: Dict[str, Dict[str, Any]] = {}
+        self.tokens: Dict[str, ServiceToken] = {}
         self.auth_manager = get_auth_manager()
         self.logger = logger.bind(component="token_manager")
     
@@ -310,19 +490,19 @@ class TokenManager:
             token_response = self.auth_manager.create_token_response(user)
             
             # Store tokens for all services
-            self.tokens["global"] = {
-                "access_token": token_response.access_token,
-                "refresh_token": token_response.refresh_token,
-                "expires_at": datetime.utcnow() + timedelta(seconds=token_response.expires_in),
-                "user_id": user.id,
-                "username": user.username,
-                "roles": [r.value for r in user.roles]
-            }
+            self.tokens["global"] = ServiceToken(
+                access_token=token_response.access_token,
+                refresh_token=token_response.refresh_token,
+                expires_at=time.monotonic() + token_response.expires_in,
+                user_id=user.id,
+                username=user.username,
+                roles=[r.value for r in user.roles]
+            )
             
             self.logger.info(
                 "user_authenticated",
                 username=username,
-                roles=self.tokens["global"]["roles"]
+                roles=self.tokens["global"].roles
             )
             
             return token_response
@@ -338,15 +518,9 @@ class TokenManager:
         Returns:
             Access token if available
         """
-        # Check service-specific token first
-        if service_name in self.tokens:
-            return self.tokens[service_name].get("access_token")
-        
-        # Fall back to global token
-        if "global" in self.tokens:
-            return self.tokens["global"].get("access_token")
-        
-        return None
+        # Service-specific token first, then the global one
+        token = self.tokens.get(service_name) or self.tokens.get("global")
+        return token.access_token if token else None
     
     def get_refresh_token_for_service(self, service_name: str) -> Optional[str]:
         """Get refresh token for a service.
@@ -357,15 +531,9 @@ class TokenManager:
         Returns:
             Refresh token if available
         """
-        # Check service-specific token first
-        if service_name in self.tokens:
-            return self.tokens[service_name].get("refresh_token")
-        
-        # Fall back to global token
-        if "global" in self.tokens:
-            return self.tokens["global"].get("refresh_token")
-        
-        return None
+        # Service-specific token first, then the global one
+        token = self.tokens.get(service_name) or self.tokens.get("global")
+        return token.refresh_token if token else None
     
     async def refresh_token_for_service(self, service_name: str) -> bool:
         """Refresh token for a service.
@@ -387,21 +555,20 @@ class TokenManager:
             token_response = self.auth_manager.refresh_access_token(refresh_request)
             
             # Update stored tokens
-            token_data = {
-                "access_token": token_response.access_token,
-                "refresh_token": token_response.refresh_token,
-                "expires_at": datetime.utcnow() + timedelta(seconds=token_response.expires_in)
-            }
+            token = ServiceToken(
+                access_token=token_response.access_token,
+                refresh_token=token_response.refresh_token,
+                expires_at=time.monotonic() + token_response.expires_in
+            )
             
-            # Preserve other data if updating global token
-            if service_name == "global" and "global" in self.tokens:
-                token_data.update({
-                    "user_id": self.tokens["global"].get("user_id"),
-                    "username": self.tokens["global"].get("username"),
-                    "roles": self.tokens["global"].get("roles")
-                })
+            # Preserve user data if updating global token
+            previous = self.tokens.get("global")
+            if service_name == "global" and previous:
+                token.user_id = previous.user_id
+                token.username = previous.username
+                token.roles = previous.roles
             
-            self.tokens[service_name] = token_data
+            self.tokens[service_name] = token
             
             self.logger.info(
                 "token_refreshed",
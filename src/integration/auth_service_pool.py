@@ -4,47 +4,62 @@ Authenticated service pool for DEAN orchestration.
 Extends the service pool with authentication support.
 """
 
+import asyncio
 import os
-from typing import Optional
+from typing import Dict, Optional
+import aiohttp
 import structlog
 
 from .auth_base import AuthenticatedServiceClient, TokenManager
+from .base import LazySession
 from .service_adapters import ServicePool
 
 # Configure logging
 logger = structlog.get_logger(__name__)
 
 
-class AuthenticatedIndexAgentClient(AuthenticatedServiceClient):
-    """IndexAgent client with authentication."""
+class IndexAgentAPI:
+    """IndexAgent API calls over a shared authenticated client."""
+    
+    def __init__(self, client: AuthenticatedServiceClient):
+        self.client = client
+    
+    @property
+    def base_url(self) -> str:
+        """Base URL of the underlying client."""
+        return self.client.base_url
+    
+    async def health_check(self):
+        """Check service health."""
+        return await self.client.get("/health")
     
     async def list_agents(self, limit: int = 100, offset: int = 0):
         """List agents with pagination."""
-        return await self.get("/agents", params={"limit": limit, "offset": offset})
+        return await self.client.get("/agents", params={"limit": limit, "offset": offset})
     
     async def create_agent(self, agent_config: dict):
         """Create a new agent."""
-        return await self.post("/agents", json=agent_config)
+        return await self.client.post("/agents", json=agent_config)
     
     async def get_agent(self, agent_id: str):
         """Get a specific agent."""
-        return await self.get(f"/agents/{agent_id}")
+        return await self.client.get(f"/agents/{agent_id}")
     
     async def delete_agent(self, agent_id: str):
         """Delete an agent."""
-        return await self.delete(f"/agents/{agent_id}")
+        return await self.client.delete(f"/agents/{agent_id}")
     
     async def get_patterns(self, **params):
         """Get discovered patterns."""
-        return await self.get("/patterns", params=params)
+        return await self.client.get("/patterns", params=params)
     
     async def search(self, query: dict):
         """Search for code patterns."""
-        return await self.post("/search", json=query)
+        return await self.client.post("/search", json=query)
     
     async def get_metrics(self):
         """Get service metrics."""
-        return await self.get("/metrics")
+        return await self.client.get("/metrics")
 
 
 class AuthenticatedAirflowClient(AuthenticatedServiceClient):
@@ -58,11 +73,8 @@ class AuthenticatedAirflowClient(AuthenticatedServiceClient):
         self.airflow_username = os.getenv("AIRFLOW_USERNAME", "airflow")
         self.airflow_password = os.getenv("AIRFLOW_PASSWORD", "airflow")
         
-        # Set basic auth header
-        import base64
-        credentials = f"{self.airflow_username}:{self.airflow_password}"
-        encoded_credentials = base64.b64encode(credentials.encode()).decode()
-        self._session.headers["Authorization"] = f"Basic {encoded_credentials}"
+        # Basic auth is sent unless a bearer token takes precedence
+        self.auth = aiohttp.BasicAuth(self.airflow_username, self.airflow_password)
     
     async def list_dags(self, **params):
         """List DAGs."""
@@ -78,28 +90,45 @@ class AuthenticatedAirflowClient(AuthenticatedServiceClient):
         return await self.get(f"/api/v1/dags/{dag_id}/dagRuns/{dag_run_id}")
 
 
-class AuthenticatedEvolutionClient(AuthenticatedServiceClient):
-    """Evolution API client with authentication."""
+class EvolutionAPI:
+    """Evolution API calls over a shared authenticated client."""
+    
+    def __init__(self, client: AuthenticatedServiceClient):
+        self.client = client
+    
+    @property
+    def base_url(self) -> str:
+        """Base URL of the underlying client."""
+        return self.client.base_url
+    
+    async def health_check(self):
+        """Check service health."""
+        return await self.client.get("/health")
     
     async def start_evolution(self, config: dict):
         """Start an evolution trial."""
-        return await self.post("/evolution/start", json=config)
+        return await self.client.post("/evolution/start", json=config)
     
     async def get_trial_status(self, trial_id: str):
         """Get evolution trial status."""
-        return await self.get(f"/evolution/{trial_id}/status")
+        return await self.client.get(f"/evolution/{trial_id}/status")
     
     async def list_trials(self, **params):
         """List evolution trials."""
-        return await self.get("/evolution/trials", params=params)
+        return await self.client.get("/evolution/trials", params=params)
+    
+    async def aiter_trials(self, **params):
+        """Iterate over evolution trials as they are received."""
+        async for trial in self.client.aiter_get("/evolution/trials", params=params):
+            yield trial
     
     async def get_patterns(self, **params):
         """Get discovered patterns."""
-        return await self.get("/patterns", params=params)
+        return await self.client.get("/patterns", params=params)
     
     async def get_metrics(self):
         """Get evolution metrics."""
-        return await self.get("/evolution/metrics")
+        return await self.client.get("/evolution/metrics")
 
 
 class AuthenticatedServicePool(ServicePool):
@@ -109,11 +138,16 @@ class AuthenticatedServicePool(ServicePool):
     - Centralized token management
     - Automatic token refresh
     - Service-specific authentication
+    - One HTTP session (connection pool) shared by all clients
     """
     
     def __init__(self):
         """Initialize authenticated service pool."""
-        super().__init__()
+        # Single connection pool shared by all clients, including the
+        # unauthenticated ones behind the inherited adapters; credentials
+        # are applied per client through request headers
+        self._session = LazySession(timeout=30)
+        super().__init__(session=self._session)
         
         # Initialize token manager
         self.token_manager = TokenManager()
@@ -124,23 +158,20 @@ class AuthenticatedServicePool(ServicePool):
         evolution_url = os.getenv("EVOLUTION_API_URL", "http://localhost:8083")
         auth_url = os.getenv("DEAN_ORCHESTRATION_URL", "http://localhost:8082")
         
-        # Create authenticated clients
-        self.indexagent = AuthenticatedIndexAgentClient(
-            base_url=indexagent_url,
-            service_name="indexagent",
-            auth_endpoint=auth_url
-        )
+        # Services behind the same base URL share one authenticated client,
+        # and with it a single copy of the token state
+        self._auth_endpoint = auth_url
+        self._auth_clients: Dict[str, AuthenticatedServiceClient] = {}
         
+        self.indexagent = IndexAgentAPI(self._auth_client(indexagent_url, "indexagent"))
+        self.evolution = EvolutionAPI(self._auth_client(evolution_url, "evolution"))
+        
+        # Airflow authenticates with basic auth, so it keeps its own client
         self.airflow = AuthenticatedAirflowClient(
             base_url=airflow_url,
             service_name="airflow",
-            auth_endpoint=auth_url
-        )
-        
-        self.evolution = AuthenticatedEvolutionClient(
-            base_url=evolution_url,
-            service_name="evolution",
-            auth_endpoint=auth_url
+            auth_endpoint=auth_url,
+            session=self._session
         )
         
         logger.info(
@@ -153,6 +184,19 @@ class AuthenticatedServicePool(ServicePool):
             }
         )
     
+    def _auth_client(self, base_url: str, service_name: str) -> AuthenticatedServiceClient:
+        """Return the authenticated client for a base URL, creating it once."""
+        key = base_url.rstrip('/')
+        client = self._auth_clients.get(key)
+        if client is None:
+            client = self._auth_clients[key] = AuthenticatedServiceClient(
+                base_url=base_url,
+                service_name=service_name,
+                auth_endpoint=self._auth_endpoint,
+                session=self._session
+            )
+        return client
+    
     async def authenticate(self, username: str, password: str) -> bool:
         """Authenticate and set tokens for all services.
         
@@ -168,12 +212,16 @@ class AuthenticatedServicePool(ServicePool):
         
         if token_response:
             # Set tokens for all services
-            for service in [self.indexagent, self.evolution]:
-                await service.set_auth_token(
+            clients = list(self._auth_clients.values())
+            await asyncio.gather(*(
+                client.set_auth_token(
                     token_response.access_token,
                     token_response.expires_in
                 )
-                service.refresh_token = token_response.refresh_token
+                for client in clients
+            ))
+            for client in clients:
+                client.refresh_token = token_response.refresh_token
             
             logger.info(
                 "service_pool_authenticated",
@@ -193,8 +241,9 @@ class AuthenticatedServicePool(ServicePool):
         Args:
             api_key: API key to use
         """
-        for service in [self.indexagent, self.evolution]:
-            await service.set_api_key(api_key)
+        await asyncio.gather(*(
+            client.set_api_key(api_key) for client in self._auth_clients.values()
+        ))
         
         logger.info("api_key_set_for_all_services")
     
@@ -204,26 +253,30 @@ class AuthenticatedServicePool(ServicePool):
         Returns:
             True if all refreshes successful
         """
-        success = True
+        clients = list(self._auth_clients.values())
+        results = await asyncio.gather(
+            *(client.refresh_auth_token() for client in clients)
+        )
         
-        for service_name, service in [
-            ("indexagent", self.indexagent),
-            ("evolution", self.evolution)
-        ]:
-            if not await service.refresh_auth_token():
+        for client, refreshed in zip(clients, results):
+            if not refreshed:
                 logger.error(
                     "token_refresh_failed",
-                    service=service_name
+                    service=client.service_name
                 )
-                success = False
         
-        return success
+        return all(results)
     
     async def close(self):
         """Close all service connections."""
-        await self.indexagent.close()
-        await self.airflow.close()
-        await self.evolution.close()
+        await asyncio.gather(
+            *(client.close() for client in self._auth_clients.values()),
+            self.airflow.close(),
+            # Unauthenticated clients backing the inherited adapters
+            super().close(),
+            return_exceptions=True
+        )
+        await self._session.close()
         
         logger.info("authenticated_service_pool_closed")
 
@@ -2,22 +2,171 @@
 
 import asyncio
 import logging
-from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Union
-from datetime import datetime
+import os
+import random
+import time
+from abc import ABC
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional, Set, Tuple, Union
+from datetime import datetime, timezone
 import aiohttp
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-    before_sleep_log,
-)
+import orjson
+from cachetools import TTLCache
 import structlog
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import aiodns  # noqa: F401 - enables aiohttp.AsyncResolver
+except ImportError:
+    aiodns = None
+
 # Configure structured logging
 logger = structlog.get_logger(__name__)
 
+# Request/response debug events are only built when this stdlib logger is
+# at DEBUG, keeping kwargs and payload formatting off the hot path
+_debug_logger = logging.getLogger(__name__)
+
+
+def enable_uvloop() -> bool:
+    """Install uvloop as the asyncio event loop policy if it is available.
+    
+    Must be called before the event loop is created (e.g. before
+    ``asyncio.run``). uvloop ships with ``uvicorn[standard]``; on platforms
+    without it (Windows) the default loop is kept.
+    
+    Returns:
+        True if uvloop was installed
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+# Timeout for the default health probe
+_HEALTH_TIMEOUT = aiohttp.ClientTimeout(total=2)
+
+# HTTP statuses worth retrying; other 4xx responses fail immediately
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Methods safe to resend; a timed-out POST/PATCH may already have been applied
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+
+
+def _select_items(data: Any, json_path: str) -> List[Any]:
+    """Select the values an ijson prefix would yield from parsed JSON."""
+    nodes = [data]
+    for part in json_path.split('.'):
+        if part == 'item':
+            nodes = [child for node in nodes if isinstance(node, list) for child in node]
+        else:
+            nodes = [node[part] for node in nodes if isinstance(node, dict) and part in node]
+    return nodes
+
+
+# numpy arrays (e.g. fitness vectors) serialize natively, without tolist()
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+
+def _encode_body(json: Any, data: Optional[bytes]) -> Optional[bytes]:
+    """Encode a JSON request body to bytes, or pass pre-serialized data."""
+    return orjson.dumps(json, option=_ORJSON_OPTIONS) if json is not None else data
+
+
+def _json_serialize(obj: Any) -> str:
+    """Serialize request bodies with orjson for aiohttp's ``json=`` path."""
+    return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
+
+
+def create_session(
+    timeout: int = 30,
+    pool_size: Optional[int] = None,
+    pool_size_per_host: Optional[int] = None,
+) -> aiohttp.ClientSession:
+    """Create an HTTP session with the default JSON configuration.
+    
+    Pool limits default to the ``DEAN_POOL_MAX`` (256) and
+    ``DEAN_POOL_PER_HOST`` (64) environment variables. Resolved addresses
+    are cached for five minutes and idle connections are kept alive for
+    75 seconds. When aiodns is installed, lookups go through c-ares
+    instead of the default thread-pool resolver.
+    
+    Args:
+        timeout: Request timeout in seconds
+        pool_size: Total connection pool size
+        pool_size_per_host: Connection limit per host
+        
+    Returns:
+        Configured aiohttp session
+    """
+    if pool_size is None:
+        pool_size = int(os.getenv("DEAN_POOL_MAX", "256"))
+    if pool_size_per_host is None:
+        pool_size_per_host = int(os.getenv("DEAN_POOL_PER_HOST", "64"))
+    
+    connector = aiohttp.TCPConnector(
+        limit=pool_size,
+        limit_per_host=min(pool_size_per_host, pool_size),
+        use_dns_cache=True,
+        ttl_dns_cache=300,
+        happy_eyeballs_delay=0.1,
+        keepalive_timeout=75,
+        enable_cleanup_closed=True,
+        resolver=aiohttp.AsyncResolver() if aiodns is not None else None,
+    )
+    
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=timeout),
+        json_serialize=_json_serialize,
+        headers={
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+        }
+    )
+
+
+class LazySession:
+    """HTTP session created on first use.
+    
+    Creating an aiohttp session requires a running event loop, so clients
+    hold one of these and open the session from inside a coroutine. A
+    single instance may be shared by several clients; the session is
+    recreated if it is used again after ``close()``.
+    
+    Args:
+        **session_kwargs: Arguments for ``create_session``
+    """
+    
+    def __init__(self, **session_kwargs):
+        self._session_kwargs = session_kwargs
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._lock = asyncio.Lock()
+    
+    async def get(self) -> aiohttp.ClientSession:
+        """Return the open session, creating it if needed."""
+        session = self._session
+        if session is None or session.closed:
+            async with self._lock:
+                if self._session is None or self._session.closed:
+                    self._session = create_session(**self._session_kwargs)
+            session = self._session
+        return session
+    
+    async def close(self) -> None:
+        """Close the session if it is open."""
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            await session.close()
+
 
 class ServiceError(Exception):
     """Base exception for service-related errors."""
@@ -26,7 +175,12 @@ class ServiceError(Exception):
         super().__init__(message)
         self.service = service
         self.details = details or {}
-        self.timestamp = datetime.utcnow().isoformat()
+        self._ts_ns = time.time_ns()
+    
+    @property
+    def timestamp(self) -> str:
+        """ISO-8601 UTC time the error was raised, formatted on access."""
+        return datetime.fromtimestamp(self._ts_ns / 1e9, tz=timezone.utc).isoformat()
 
 
 class ServiceTimeout(ServiceError):
@@ -39,6 +193,141 @@ class ServiceConnectionError(ServiceError):
     pass
 
 
+class RequestPipeline:
+    """Collects client calls and runs them concurrently.
+    
+    Returned by ``ServiceClient.pipeline()``; calls added inside the block
+    are awaited together when it exits and their results, in submission
+    order, are available as ``results``.
+    """
+    
+    def __init__(self):
+        self._calls: List[Awaitable[Any]] = []
+        self.results: List[Any] = []
+    
+    def add(self, call: Awaitable[Any]) -> int:
+        """Queue a call.
+        
+        Args:
+            call: Un-awaited client call, e.g. ``client.get_agent(agent_id)``
+            
+        Returns:
+            Index of the call's result in ``results``
+        """
+        self._calls.append(call)
+        return len(self._calls) - 1
+    
+    async def execute(self) -> List[Any]:
+        """Run all queued calls concurrently."""
+        calls, self._calls = self._calls, []
+        self.results = list(await asyncio.gather(*calls))
+        return self.results
+    
+    def discard(self) -> None:
+        """Drop queued calls without running them."""
+        calls, self._calls = self._calls, []
+        for call in calls:
+            if asyncio.iscoroutine(call):
+                call.close()
+
+
+class BatchingMixin:
+    """Coalesces single-item GETs into bulk ``?ids=`` requests.
+    
+    For ServiceClient subclasses whose backend accepts a comma-separated
+    ``ids`` query parameter on a collection endpoint and returns a list of
+    items carrying an ``id`` field. Lookups issued within ``batch_window``
+    seconds of each other share one request; a batch is sent early once it
+    holds ``max_batch`` distinct IDs.
+    """
+    
+    def _init_batching(self, batch_window: float = 0.002, max_batch: int = 32):
+        """Initialize batching state.
+        
+        Args:
+            batch_window: Seconds to collect lookups before sending
+            max_batch: Maximum distinct IDs per request
+        """
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self._pending_batches: Dict[str, Dict[str, List[asyncio.Future]]] = {}
+        self._batch_tasks: Set[asyncio.Task] = set()
+    
+    async def _batched_get(self, endpoint: str, item_id: str) -> Dict[str, Any]:
+        """Fetch one item through the batching window.
+        
+        Args:
+            endpoint: Collection endpoint accepting ``ids``
+            item_id: Identifier of the item to fetch
+            
+        Returns:
+            The matching item
+            
+        Raises:
+            ServiceError: If the request fails or the item is not returned
+        """
+        batch = self._pending_batches.get(endpoint)
+        if batch is None:
+            batch = self._pending_batches[endpoint] = {}
+            self._spawn_batch_task(self._flush_batch_later(endpoint, batch))
+        
+        future = asyncio.get_running_loop().create_future()
+        batch.setdefault(item_id, []).append(future)
+        
+        if len(batch) >= self.max_batch:
+            del self._pending_batches[endpoint]
+            self._spawn_batch_task(self._flush_batch(endpoint, batch))
+        
+        return await future
+    
+    def _spawn_batch_task(self, coro) -> None:
+        """Run a flush in the background, keeping a reference until done."""
+        task = asyncio.create_task(coro)
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+    
+    async def _flush_batch_later(
+        self,
+        endpoint: str,
+        batch: Dict[str, List[asyncio.Future]],
+    ) -> None:
+        """Send a batch once its window closes, unless it was already sent."""
+        await asyncio.sleep(self.batch_window)
+        if self._pending_batches.get(endpoint) is batch:
+            del self._pending_batches[endpoint]
+            await self._flush_batch(endpoint, batch)
+    
+    async def _flush_batch(
+        self,
+        endpoint: str,
+        batch: Dict[str, List[asyncio.Future]],
+    ) -> None:
+        """Issue the bulk request and resolve every waiter in the batch."""
+        try:
+            items = await self.get(endpoint, params={"ids": ",".join(batch)})
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        
+        by_id = {str(item.get("id")): item for item in items or []}
+        for item_id, futures in batch.items():
+            item = by_id.get(item_id)
+            for future in futures:
+                if future.done():
+                    continue
+                if item is None:
+                    future.set_exception(ServiceError(
+                        f"{self.service_name} returned no item {item_id}",
+                        self.service_name,
+                        {'status_code': 404, 'endpoint': endpoint, 'id': item_id}
+                    ))
+                else:
+                    future.set_result(item)
+
+
 class ServiceClient(ABC):
     """Abstract base class for service clients.
     
@@ -48,6 +337,9 @@ class ServiceClient(ABC):
     - Structured logging
     - Error handling
     - Health checking
+    
+    Throughput is best with uvloop (see ``enable_uvloop``) and aiodns
+    installed; both are optional and fall back to the asyncio defaults.
     """
     
     def __init__(
@@ -56,7 +348,8 @@ class ServiceClient(ABC):
         service_name: str,
         timeout: int = 30,
         max_retries: int = 3,
-        pool_size: int = 10,
+        pool_size: Optional[int] = None,
+        session: Optional[Union[aiohttp.ClientSession, LazySession]] = None,
     ):
         """Initialize service client.
         
@@ -65,28 +358,32 @@ class ServiceClient(ABC):
             service_name: Name of the service for logging
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
-            pool_size: Connection pool size
+            pool_size: Connection pool size (defaults to ``DEAN_POOL_MAX``)
+            session: Shared session to use instead of creating one; the
+                owner of a shared session is responsible for closing it
         """
         self.base_url = base_url.rstrip('/')
         self.service_name = service_name
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.max_retries = max_retries
         
-        # Connection pool configuration
-        connector = aiohttp.TCPConnector(
-            limit=pool_size,
-            limit_per_host=pool_size,
-        )
+        # Per-client headers sent with every request. Kept off the session
+        # so clients sharing a session do not see each other's credentials.
+        self.headers: Dict[str, str] = {}
         
-        # Create session with default configuration
-        self._session = aiohttp.ClientSession(
-            connector=connector,
-            timeout=self.timeout,
-            headers={
-                'Content-Type': 'application/json',
-                'Accept': 'application/json',
-            }
-        )
+        # Per-client basic auth; an explicit Authorization header wins
+        self.auth: Optional[aiohttp.BasicAuth] = None
+        
+        # (etag, raw JSON body) of recent GETs, revalidated with
+        # If-None-Match; parsed afresh on every hit so callers never share
+        # (and cannot mutate) a cached object
+        self._get_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+        
+        # (monotonic time, result) of the last validate_connection
+        self._health_cache: Tuple[float, bool] = (0.0, False)
+        
+        self._owns_session = session is None
+        self._session = session or LazySession(timeout=timeout, pool_size=pool_size)
         
         self.logger = logger.bind(service=service_name)
     
@@ -99,15 +396,39 @@ class ServiceClient(ABC):
         await self.close()
     
     async def close(self):
-        """Close the HTTP session."""
-        await self._session.close()
-    
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError)),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-    )
+        """Close the HTTP session if this client owns it."""
+        if self._owns_session:
+            await self._session.close()
+    
+    @asynccontextmanager
+    async def pipeline(self) -> AsyncIterator[RequestPipeline]:
+        """Submit several calls and run them concurrently on block exit.
+        
+        Usage:
+            async with client.pipeline() as pipe:
+                pipe.add(client.get("/a"))
+                pipe.add(client.get("/b"))
+            first, second = pipe.results
+        """
+        pipe = RequestPipeline()
+        try:
+            yield pipe
+        except BaseException:
+            pipe.discard()
+            raise
+        await pipe.execute()
+    
+    @property
+    def session(self) -> Union[aiohttp.ClientSession, LazySession]:
+        """Session this client sends requests over, for sharing with other clients."""
+        return self._session
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the HTTP session, opening it on first use."""
+        if isinstance(self._session, LazySession):
+            return await self._session.get()
+        return self._session
+    
     async def _request(
         self,
         method: str,
@@ -116,6 +437,11 @@ class ServiceClient(ABC):
     ) -> Union[Dict[str, Any], list, None]:
         """Execute HTTP request with retry logic.
         
+        For idempotent methods, timeouts, connection failures and
+        RETRY_STATUSES responses are retried up to ``max_retries`` attempts
+        with jittered exponential backoff (1s doubling to 10s). POST and
+        PATCH requests are sent once.
+        
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint (relative to base_url)
@@ -129,104 +455,348 @@ class ServiceClient(ABC):
             ServiceConnectionError: On connection failure
             ServiceError: On other errors
         """
+        attempts = max(self.max_retries, 1) if method.upper() in IDEMPOTENT_METHODS else 1
+        delay = 1.0
+        for attempt in range(attempts):
+            try:
+                return await self._do_request(method, endpoint, **kwargs)
+            except ServiceError as e:
+                if attempt == attempts - 1 or not self._is_retryable(e):
+                    raise
+                self.logger.warning(
+                    "service_retry",
+                    attempt=attempt + 1,
+                    delay=delay,
+                    error=str(e),
+                )
+                await asyncio.sleep(delay + random.random() * 0.1)
+                delay = min(delay * 2, 10.0)
+    
+    @staticmethod
+    def _is_retryable(error: ServiceError) -> bool:
+        """Check whether a failed request is transient."""
+        if isinstance(error, (ServiceTimeout, ServiceConnectionError)):
+            return True
+        return error.details.get('status_code') in RETRY_STATUSES
+    
+    async def _do_request(
+        self,
+        method: str,
+        endpoint: str,
+        cache_key: Optional[tuple] = None,
+        **kwargs
+    ) -> Union[Dict[str, Any], list, None]:
+        """Execute a single HTTP request attempt.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint (relative to base_url)
+            cache_key: ETag cache key for conditional GETs
+            **kwargs: Additional arguments for aiohttp request
+            
+        Returns:
+            Parsed JSON response or None
+        """
         url = f"{self.base_url}{endpoint}"
+        self._apply_headers(kwargs)
         
-        self.logger.debug(
-            "service_request",
-            method=method,
-            url=url,
-            kwargs=kwargs,
-        )
+        cached = None
+        if cache_key is not None:
+            cached = self._get_cache.get(cache_key)
+            if cached is not None:
+                kwargs['headers'] = {**(kwargs.get('headers') or {}), 'If-None-Match': cached[0]}
+        
+        debug = _debug_logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug(
+                "service_request",
+                method=method,
+                url=url,
+                kwargs=kwargs,
+            )
         
         try:
-            async with self._session.request(method, url, **kwargs) as response:
+            session = await self._get_session()
+            async with session.request(method, url, **kwargs) as response:
+                if response.status == 304 and cached is not None:
+                    return orjson.loads(cached[1]) if cached[1] else None
+                
+                body = b''
                 response_data = None
-                if response.content_type == 'application/json':
-                    response_data = await response.json()
+                if method != 'HEAD' and response.content_type == 'application/json':
+                    body = await response.read()
+                    response_data = orjson.loads(body) if body else None
                 
-                self.logger.debug(
-                    "service_response",
-                    status=response.status,
-                    response_data=response_data,
-                )
+                if debug:
+                    self.logger.debug(
+                        "service_response",
+                        status=response.status,
+                        response_data=response_data,
+                    )
                 
                 if response.status >= 400:
-                    error_msg = f"{self.service_name} returned {response.status}"
-                    if response_data and isinstance(response_data, dict):
-                        error_msg = response_data.get('message', error_msg)
-                    
-                    raise ServiceError(
-                        error_msg,
-                        self.service_name,
-                        {
-                            'status_code': response.status,
-                            'response': response_data,
-                        }
-                    )
+                    raise self._status_error(response.status, response_data)
+                
+                if cache_key is not None and response.status == 200:
+                    etag = response.headers.get('ETag')
+                    if etag:
+                        self._get_cache[cache_key] = (etag, body)
                 
                 return response_data
                 
-        except asyncio.TimeoutError as e:
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            raise self._client_error(e, url) from e
+    
+    async def _request_iter(
+        self,
+        method: str,
+        endpoint: str,
+        json_path: str = "item",
+        **kwargs
+    ) -> AsyncIterator[Any]:
+        """Execute HTTP request and yield JSON items as they are parsed.
+        
+        Uses ijson to parse the body incrementally when it is installed;
+        otherwise the body is buffered and the same items are yielded.
+        Streaming requests are not retried.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint (relative to base_url)
+            json_path: ijson prefix of the items to yield ("item" yields
+                the elements of a top-level array)
+            **kwargs: Additional arguments for aiohttp request
+            
+        Yields:
+            Parsed JSON items
+            
+        Raises:
+            ServiceTimeout: On request timeout
+            ServiceConnectionError: On connection failure
+            ServiceError: On other errors
+        """
+        url = f"{self.base_url}{endpoint}"
+        self._apply_headers(kwargs)
+        
+        try:
+            session = await self._get_session()
+            async with session.request(method, url, **kwargs) as response:
+                if response.status >= 400:
+                    response_data = None
+                    if response.content_type == 'application/json':
+                        body = await response.read()
+                        response_data = orjson.loads(body) if body else None
+                    raise self._status_error(response.status, response_data)
+                
+                if response.content_type != 'application/json' or response.content_length == 0:
+                    return
+                
+                if ijson is not None:
+                    async for item in ijson.items(response.content, json_path, use_float=True):
+                        yield item
+                else:
+                    body = await response.read()
+                    if not body:
+                        return
+                    data = orjson.loads(body)
+                    for item in _select_items(data, json_path):
+                        yield item
+                        
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            raise self._client_error(e, url) from e
+    
+    def _apply_headers(self, kwargs: Dict[str, Any]) -> None:
+        """Merge per-client headers and auth into request kwargs."""
+        if self.headers:
+            headers = kwargs.get('headers')
+            kwargs['headers'] = {**self.headers, **headers} if headers else self.headers
+        
+        if self.auth is not None and 'Authorization' not in (kwargs.get('headers') or {}):
+            kwargs.setdefault('auth', self.auth)
+    
+    def _status_error(self, status: int, response_data: Any) -> ServiceError:
+        """Build the error for an HTTP error response."""
+        error_msg = f"{self.service_name} returned {status}"
+        if response_data and isinstance(response_data, dict):
+            error_msg = response_data.get('message', error_msg)
+        
+        return ServiceError(
+            error_msg,
+            self.service_name,
+            {
+                'status_code': status,
+                'response': response_data,
+            }
+        )
+    
+    def _client_error(self, error: Exception, url: str) -> ServiceError:
+        """Log a transport failure and convert it to a ServiceError."""
+        if isinstance(error, asyncio.TimeoutError):
             self.logger.error("service_timeout", url=url)
-            raise ServiceTimeout(
+            return ServiceTimeout(
                 f"Request to {self.service_name} timed out",
                 self.service_name,
                 {'url': url}
-            ) from e
-            
-        except aiohttp.ClientConnectionError as e:
-            self.logger.error("service_connection_error", url=url, error=str(e))
-            raise ServiceConnectionError(
+            )
+        
+        if isinstance(error, aiohttp.ClientConnectionError):
+            self.logger.error("service_connection_error", url=url, error=str(error))
+            return ServiceConnectionError(
                 f"Failed to connect to {self.service_name}",
                 self.service_name,
-                {'url': url, 'error': str(e)}
-            ) from e
-            
-        except aiohttp.ClientError as e:
-            self.logger.error("service_client_error", url=url, error=str(e))
-            raise ServiceError(
-                f"Error communicating with {self.service_name}",
-                self.service_name,
-                {'url': url, 'error': str(e)}
-            ) from e
+                {'url': url, 'error': str(error)}
+            )
+        
+        self.logger.error("service_client_error", url=url, error=str(error))
+        return ServiceError(
+            f"Error communicating with {self.service_name}",
+            self.service_name,
+            {'url': url, 'error': str(error)}
+        )
     
     async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
-        """Execute GET request."""
-        return await self._request('GET', endpoint, params=params)
+        """Execute GET request.
+        
+        Responses carrying an ETag are cached for a minute and revalidated
+        with If-None-Match; a 304 returns a freshly parsed copy of the
+        cached payload.
+        """
+        try:
+            cache_key = (endpoint, tuple(sorted(params.items())) if params else ())
+            hash(cache_key)
+        except TypeError:
+            cache_key = None
+        
+        return await self._request('GET', endpoint, params=params, cache_key=cache_key)
+    
+    async def aiter_get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_path: str = "item",
+    ) -> AsyncIterator[Any]:
+        """Execute GET request and yield JSON items as they are parsed.
+        
+        Streaming variant of ``get`` for large listings; the response is
+        neither cached nor retried.
+        
+        Args:
+            endpoint: API endpoint (relative to base_url)
+            params: Query parameters
+            json_path: ijson prefix of the items to yield ("item" yields
+                the elements of a top-level array)
+            
+        Yields:
+            Parsed JSON items
+        """
+        async for item in self._request_iter('GET', endpoint, json_path, params=params):
+            yield item
     
-    async def post(self, endpoint: str, json: Optional[Dict[str, Any]] = None) -> Any:
-        """Execute POST request."""
-        return await self._request('POST', endpoint, json=json)
+    async def post(
+        self,
+        endpoint: str,
+        json: Optional[Dict[str, Any]] = None,
+        data: Optional[bytes] = None,
+    ) -> Any:
+        """Execute POST request.
+
+        ``json`` is encoded straight to bytes with orjson; ``data``
+        carries a body that was already serialized by the caller.
+        """
+        self.invalidate_get_cache(endpoint)
+        return await self._request('POST', endpoint, data=_encode_body(json, data))
     
-    async def put(self, endpoint: str, json: Optional[Dict[str, Any]] = None) -> Any:
-        """Execute PUT request."""
-        return await self._request('PUT', endpoint, json=json)
+    async def put(
+        self,
+        endpoint: str,
+        json: Optional[Dict[str, Any]] = None,
+        data: Optional[bytes] = None,
+    ) -> Any:
+        """Execute PUT request.
+
+        ``json`` is encoded straight to bytes with orjson; ``data``
+        carries a body that was already serialized by the caller.
+        """
+        self.invalidate_get_cache(endpoint)
+        return await self._request('PUT', endpoint, data=_encode_body(json, data))
     
-    async def patch(self, endpoint: str, json: Optional[Dict[str, Any]] = None) -> Any:
-        """Execute PATCH request."""
-        return await self._request('PATCH', endpoint, json=json)
+    async def patch(
+        self,
+        endpoint: str,
+        json: Optional[Dict[str, Any]] = None,
+        data: Optional[bytes] = None,
+    ) -> Any:
+        """Execute PATCH request.
+
+        ``json`` is encoded straight to bytes with orjson; ``data``
+        carries a body that was already serialized by the caller.
+        """
+        self.invalidate_get_cache(endpoint)
+        return await self._request('PATCH', endpoint, data=_encode_body(json, data))
     
     async def delete(self, endpoint: str) -> Any:
         """Execute DELETE request."""
+        self.invalidate_get_cache(endpoint)
         return await self._request('DELETE', endpoint)
     
-    @abstractmethod
+    def invalidate_get_cache(self, endpoint: Optional[str] = None) -> None:
+        """Drop cached GET responses related to an endpoint.
+        
+        Writes call this automatically. Entries for the endpoint itself,
+        for paths below it and for its parent collection are dropped (for
+        ``/agents/123``: ``/agents/123``, ``/agents/123/lineage`` and
+        ``/agents``); unrelated paths under the same prefix stay cached.
+        
+        Args:
+            endpoint: Endpoint that changed (all entries if not specified)
+        """
+        if not self._get_cache:
+            return
+        if endpoint is None:
+            self._get_cache.clear()
+            return
+        
+        path = '/' + endpoint.strip('/')
+        parent = path.rsplit('/', 1)[0]
+        stale = [
+            key for key in self._get_cache
+            if key[0] == path or key[0].startswith(path + '/') or key[0] == parent
+        ]
+        for key in stale:
+            self._get_cache.pop(key, None)
+    
     async def health_check(self) -> Dict[str, Any]:
         """Check service health.
         
+        The default is a single ``GET /health`` attempt with a 2 second
+        timeout, returning the service's report (or ``{'status': 'healthy'}``
+        if the body is not a JSON object).
+        
         Returns:
             Health status dictionary
         """
-        pass
+        data = await self._do_request('GET', '/health', timeout=_HEALTH_TIMEOUT)
+        return data if isinstance(data, dict) else {'status': 'healthy'}
     
     async def validate_connection(self) -> bool:
         """Validate service connection.
         
+        Results are reused for one second so frequent readiness probes do
+        not each reach the service.
+        
         Returns:
             True if service is reachable and healthy
         """
+        checked_at, healthy = self._health_cache
+        now = time.monotonic()
+        if now - checked_at < 1.0:
+            return healthy
+        
         try:
             health = await self.health_check()
-            return health.get('status') == 'healthy'
+            healthy = health.get('status') == 'healthy'
         except Exception:
-            return False
\ No newline at end of file
+            healthy = False
+        
+        self._health_cache = (now, healthy)
+        return healthy
\ No newline at end of file
@@ -6,27 +6,161 @@ Provides direct database access and management capabilities
 
 import asyncio
 import json
-from typing import Dict, Any, List, Optional, Union
-from datetime import datetime
+import os
+import re
+from typing import Dict, Any, AsyncIterator, Iterable, List, Optional, Sequence, Tuple, Union
 import asyncpg
 import logging
+from cachetools import TTLCache
 from contextlib import asynccontextmanager
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+
+from .timestamps import utc_now_iso
 
 logger = logging.getLogger(__name__)
 
+# PostgreSQL accepts at most 65535 bind parameters per statement
+MAX_QUERY_PARAMS = 65535
+
+# Rows per multi-VALUES INSERT; throughput plateaus beyond ~1000
+MAX_INSERT_ROWS = 1000
+
+# Keys of get_table_columns entries, in query column order
+_COLUMN_INFO_KEYS = ("name", "type", "nullable", "default")
+
+# Session settings for analytics clients: trade commit durability and JIT
+# compilation for lower per-statement latency
+_ANALYTICS_SETTINGS = {"synchronous_commit": "off", "jit": "off"}
+
+
+# Plain SQL identifier (optionally schema-qualified names are split on '.')
+_IDENT = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+@lru_cache(maxsize=1024)
+def _quote_ident(name: str) -> str:
+    """
+    Validate and quote a table or column name.
+    
+    Unquoted identifiers fold to lower case in PostgreSQL, so the quoted
+    form is lower-cased to keep the same meaning.
+    
+    Raises:
+        ValueError: If the name is not a plain (optionally schema-qualified)
+            identifier
+    """
+    parts = name.split('.')
+    if not all(_IDENT.match(part) for part in parts):
+        raise ValueError(f"Invalid SQL identifier: {name!r}")
+    return '.'.join(f'"{part.lower()}"' for part in parts)
+
+
+def _fold_ident(name: str) -> str:
+    """
+    Validate a name and fold it the way PostgreSQL folds an unquoted one.
+    
+    asyncpg's COPY helpers quote the names they are given verbatim, so
+    they must receive the folded form to reach the same table and columns
+    as the quoted SQL built by ``_quote_ident``.
+    """
+    _quote_ident(name)
+    return name.lower()
+
+
+def _values_clause(column_count: int, row_count: int) -> str:
+    """Placeholder groups ($1, $2), ($3, $4), ... for a multi-row VALUES"""
+    return ", ".join(
+        "($" + ", $".join(map(str, range(start + 1, start + column_count + 1))) + ")"
+        for start in range(0, row_count * column_count, column_count)
+    )
+
+
+@lru_cache(maxsize=1024)
+def _build_insert_sql(
+    table_name: str,
+    columns: Tuple[str, ...],
+    row_count: int,
+    on_conflict: Optional[str],
+    returning: Optional[str]
+) -> str:
+    """Build a multi-VALUES INSERT with $1..$N numbered across all rows"""
+    values_clause = _values_clause(len(columns), row_count)
+    
+    query_parts = [
+        f"INSERT INTO {_quote_ident(table_name)}",
+        f"({', '.join(map(_quote_ident, columns))})",
+        f"VALUES {values_clause}"
+    ]
+    
+    if on_conflict:
+        query_parts.append(f"ON CONFLICT {on_conflict}")
+    
+    if returning:
+        query_parts.append(f"RETURNING {returning}")
+    
+    return " ".join(query_parts)
+
+
+@lru_cache(maxsize=1024)
+def _build_update_sql(
+    table_name: str,
+    columns: Tuple[str, ...],
+    where_clause: str,
+    returning: Optional[str]
+) -> str:
+    """Build an UPDATE whose SET values are $1..$n"""
+    set_clause = ", ".join(f"{_quote_ident(col)} = ${i}" for i, col in enumerate(columns, 1))
+    
+    query_parts = [
+        f"UPDATE {_quote_ident(table_name)}",
+        f"SET {set_clause}",
+        f"WHERE {where_clause}"
+    ]
+    
+    if returning:
+        query_parts.append(f"RETURNING {returning}")
+    
+    return " ".join(query_parts)
+
+
+@lru_cache(maxsize=1024)
+def _build_delete_sql(
+    table_name: str,
+    where_clause: str,
+    returning: Optional[str]
+) -> str:
+    """Build a DELETE statement"""
+    query_parts = [
+        f"DELETE FROM {_quote_ident(table_name)}",
+        f"WHERE {where_clause}"
+    ]
+    
+    if returning:
+        query_parts.append(f"RETURNING {returning}")
+    
+    return " ".join(query_parts)
+
 
 class DatabaseClient:
     """
     Direct database client for DEAN system.
     Provides connection pooling, query execution, and transaction management.
+    
+    asyncpg is roughly twice as fast on uvloop. The loop policy must be set
+    before the event loop starts, so processes using this client should call
+    ``integration.enable_uvloop()`` at startup rather than rely on connect().
     """
     
     def __init__(
         self,
         database_url: str,
-        min_pool_size: int = 10,
-        max_pool_size: int = 20,
-        command_timeout: float = 60.0
+        min_pool_size: Optional[int] = None,
+        max_pool_size: Optional[int] = None,
+        command_timeout: float = 60.0,
+        statement_cache_size: int = 2048,
+        analytics: bool = False
     ):
         """
         Initialize database client.
@@ -34,15 +168,32 @@ class DatabaseClient:
         Args:
             database_url: PostgreSQL connection URL
             min_pool_size: Minimum number of connections in pool
+                (defaults to the CPU count, at least 4)
             max_pool_size: Maximum number of connections in pool
+                (defaults to 4x the CPU count, at most 100)
             command_timeout: Default command timeout in seconds
+            statement_cache_size: Prepared statements kept per connection
+            analytics: Disable synchronous commit and JIT on pool
+                connections for bulk/analytical workloads
         """
+        cpus = os.cpu_count() or 1
+        if max_pool_size is None:
+            max_pool_size = max(min(100, 4 * cpus), min_pool_size or 0)
+        if min_pool_size is None:
+            min_pool_size = min(max(4, cpus), max_pool_size)
+        
         self.database_url = database_url
         self.min_pool_size = min_pool_size
         self.max_pool_size = max_pool_size
         self.command_timeout = command_timeout
+        self.statement_cache_size = statement_cache_size
+        self.analytics = analytics
         self.pool: Optional[asyncpg.Pool] = None
         
+        # Catalog lookups keyed by (kind, schema, table_name)
+        self._schema_cache: TTLCache = TTLCache(maxsize=512, ttl=60)
+        
+        
     async def connect(self):
         """Establish database connection pool"""
         if self.pool:
@@ -53,9 +204,19 @@ class DatabaseClient:
                 self.database_url,
                 min_size=self.min_pool_size,
                 max_size=self.max_pool_size,
-                command_timeout=self.command_timeout
+                command_timeout=self.command_timeout,
+                # asyncpg prepares every query and keeps the statement on the
+                # connection across pool checkouts; size the cache so the
+                # helpers' query shapes are not evicted
+                statement_cache_size=self.statement_cache_size,
+                max_cached_statement_lifetime=3600,
+                max_inactive_connection_lifetime=300,
+                server_settings=_ANALYTICS_SETTINGS if self.analytics else None
+            )
+            logger.info(
+                f"Database pool created with {self.min_pool_size}-{self.max_pool_size} connections "
+                f"on {type(asyncio.get_running_loop()).__module__} event loop"
             )
-            logger.info(f"Database pool created with {self.min_pool_size}-{self.max_pool_size} connections")
         except Exception as e:
             logger.error(f"Failed to create database pool: {e}")
             raise
@@ -124,6 +285,54 @@ class DatabaseClient:
         async with self.acquire() as connection:
             return await connection.fetch(query, *args, timeout=timeout)
     
+    async def fetch_iter(
+        self,
+        query: str,
+        *args,
+        prefetch: int = 1000
+    ) -> AsyncIterator[asyncpg.Record]:
+        """
+        Execute a query and yield records through a server-side cursor.
+        
+        Memory stays bounded by ``prefetch`` rows regardless of result
+        size. The cursor holds a connection and transaction open until
+        iteration finishes.
+        
+        Args:
+            query: SQL query to execute
+            *args: Query parameters
+            prefetch: Rows fetched per round-trip
+            
+        Yields:
+            Records
+        """
+        async with self.transaction() as connection:
+            async for record in connection.cursor(query, *args, prefetch=prefetch):
+                yield record
+    
+    async def fetch_many(
+        self,
+        queries: Sequence[Tuple[str, Sequence[Any]]],
+        timeout: Optional[float] = None
+    ) -> List[List[asyncpg.Record]]:
+        """
+        Execute independent queries concurrently and fetch all results.
+        
+        Each query runs on its own pool connection (an asyncpg connection
+        processes one query at a time), so round-trips overlap up to the
+        pool size.
+        
+        Args:
+            queries: (query, parameters) pairs
+            timeout: Per-query timeout in seconds
+            
+        Returns:
+            List of record lists, in query order
+        """
+        return list(await asyncio.gather(*(
+            self.fetch(query, *args, timeout=timeout) for query, args in queries
+        )))
+    
     async def fetchrow(
         self,
         query: str,
@@ -183,7 +392,7 @@ class DatabaseClient:
             if_not_exists: Whether to use IF NOT EXISTS clause
         """
         # Build column definitions
-        column_defs = [f"{name} {dtype}" for name, dtype in columns.items()]
+        column_defs = [f"{_quote_ident(name)} {dtype}" for name, dtype in columns.items()]
         
         # Add constraints if provided
         if constraints:
@@ -192,12 +401,13 @@ class DatabaseClient:
         # Build query
         if_not_exists_clause = "IF NOT EXISTS" if if_not_exists else ""
         query = f"""
-            CREATE TABLE {if_not_exists_clause} {table_name} (
+            CREATE TABLE {if_not_exists_clause} {_quote_ident(table_name)} (
                 {', '.join(column_defs)}
             )
         """
         
         await self.execute(query)
+        self.invalidate_schema_cache(table_name)
         logger.info(f"Table {table_name} created")
     
     async def insert(
@@ -218,6 +428,9 @@ class DatabaseClient:
             
         Returns:
             Returned records if RETURNING specified
+            
+        Raises:
+            ValueError: If the records have no columns
         """
         # Normalize to list
         records = data if isinstance(data, list) else [data]
@@ -226,39 +439,115 @@ class DatabaseClient:
             return None
         
         # Get columns from first record
-        columns = list(records[0].keys())
-        
-        # Build values clause
-        values_clause = ", ".join(
-            f"({', '.join(f'${i+1}' for i in range(len(columns)))})"
-            for _ in records
-        )
-        
-        # Build query
-        query_parts = [
-            f"INSERT INTO {table_name}",
-            f"({', '.join(columns)})",
-            f"VALUES {values_clause}"
-        ]
-        
-        if on_conflict:
-            query_parts.append(f"ON CONFLICT {on_conflict}")
+        columns = tuple(records[0].keys())
+        if not columns:
+            raise ValueError(f"Cannot insert into {table_name}: record has no columns")
+        
+        # One multi-VALUES statement per chunk, kept under PostgreSQL's
+        # bind parameter limit
+        rows_per_stmt = min(len(records), MAX_QUERY_PARAMS // len(columns), MAX_INSERT_ROWS)
+        
+        # itemgetter returns a bare value (not a tuple) for a single key
+        getter = itemgetter(*columns)
+        row_values = getter if len(columns) > 1 else lambda record: (getter(record),)
+        
+        returned: List[asyncpg.Record] = []
+        async with self.transaction() as connection:
+            for start in range(0, len(records), rows_per_stmt):
+                chunk = records[start:start + rows_per_stmt]
+                query = _build_insert_sql(
+                    table_name, columns, len(chunk), on_conflict, returning
+                )
+                
+                # Flatten values
+                values = list(chain.from_iterable(map(row_values, chunk)))
+                
+                # Execute query
+                if returning:
+                    returned.extend(await connection.fetch(query, *values))
+                else:
+                    await connection.execute(query, *values)
+        
+        return returned if returning else None
+    
+    async def insert_bulk(
+        self,
+        table_name: str,
+        columns: List[str],
+        records: Iterable[Sequence[Any]],
+        schema: str = "public",
+        via_temp_table: bool = False,
+        on_conflict: Optional[str] = None,
+        returning: Optional[str] = None
+    ) -> Optional[List[asyncpg.Record]]:
+        """
+        Bulk insert rows using the binary COPY protocol.
         
-        if returning:
-            query_parts.append(f"RETURNING {returning}")
+        Much faster than ``insert`` for large batches. COPY cannot express
+        ON CONFLICT or RETURNING; with ``via_temp_table`` the rows are
+        copied into a transaction-scoped staging table and moved with a
+        single INSERT ... SELECT that supports both.
         
-        query = " ".join(query_parts)
+        Args:
+            table_name: Name of the table
+            columns: Column names, in record order
+            records: Row tuples to insert
+            schema: Schema of the table
+            via_temp_table: Stage rows in a temporary table first
+            on_conflict: ON CONFLICT clause (requires via_temp_table)
+            returning: RETURNING clause (requires via_temp_table)
+            
+        Returns:
+            Returned records if RETURNING specified
+        """
+        copy_columns = [_fold_ident(column) for column in columns]
         
-        # Flatten values
-        values = []
-        for record in records:
-            values.extend(record[col] for col in columns)
+        if not via_temp_table:
+            if on_conflict or returning:
+                raise ValueError("on_conflict and returning require via_temp_table=True")
+            
+            async with self.acquire() as connection:
+                await connection.copy_records_to_table(
+                    _fold_ident(table_name),
+                    records=records,
+                    columns=copy_columns,
+                    schema_name=_fold_ident(schema),
+                    timeout=self.command_timeout
+                )
+            return None
         
-        # Execute query
-        if returning:
-            return await self.fetch(query, *values)
-        else:
-            await self.execute(query, *values)
+        target_table = _quote_ident(f"{schema}.{table_name}")
+        column_list = ', '.join(map(_quote_ident, columns))
+        staging_table = _fold_ident(f"_bulk_{table_name}")
+        
+        async with self.transaction() as connection:
+            await connection.execute(f"""
+                CREATE TEMP TABLE {_quote_ident(staging_table)} ON COMMIT DROP AS
+                SELECT {column_list} FROM {target_table} WITH NO DATA
+            """)
+            await connection.copy_records_to_table(
+                staging_table,
+                records=records,
+                columns=copy_columns,
+                timeout=self.command_timeout
+            )
+            
+            query_parts = [
+                f"INSERT INTO {target_table} ({column_list})",
+                f"SELECT {column_list} FROM {_quote_ident(staging_table)}"
+            ]
+            
+            if on_conflict:
+                query_parts.append(f"ON CONFLICT {on_conflict}")
+            
+            if returning:
+                query_parts.append(f"RETURNING {returning}")
+            
+            query = " ".join(query_parts)
+            
+            if returning:
+                return await connection.fetch(query)
+            await connection.execute(query)
             return None
     
     async def update(
@@ -282,30 +571,13 @@ class DatabaseClient:
         Returns:
             Updated records if RETURNING specified
         """
-        # Build SET clause
-        set_parts = []
-        params = []
+        query = _build_update_sql(table_name, tuple(set_values), where_clause, returning)
         
-        for i, (col, val) in enumerate(set_values.items(), 1):
-            set_parts.append(f"{col} = ${i}")
-            params.append(val)
-        
-        # Add WHERE parameters
+        # SET values take $1..$n; WHERE parameters follow
+        params = list(set_values.values())
         if where_params:
             params.extend(where_params)
         
-        # Build query
-        query_parts = [
-            f"UPDATE {table_name}",
-            f"SET {', '.join(set_parts)}",
-            f"WHERE {where_clause}"
-        ]
-        
-        if returning:
-            query_parts.append(f"RETURNING {returning}")
-        
-        query = " ".join(query_parts)
-        
         # Execute query
         if returning:
             return await self.fetch(query, *params)
@@ -313,6 +585,33 @@ class DatabaseClient:
             await self.execute(query, *params)
             return None
     
+    async def update_many(
+        self,
+        table_name: str,
+        set_columns: List[str],
+        where_clause: str,
+        rows: Iterable[Sequence[Any]]
+    ):
+        """
+        Run the same UPDATE once per parameter row.
+        
+        The statement is parsed once and executed for every row with
+        asyncpg's ``executemany`` (pipelined since asyncpg 0.22), inside a
+        single transaction. For very large batches prefer ``insert_bulk``
+        into a staging table followed by a single UPDATE ... FROM.
+        
+        Args:
+            table_name: Name of the table
+            set_columns: Columns to set; their values take $1..$n
+            where_clause: WHERE clause (without WHERE keyword) using
+                $n+1 onwards
+            rows: Parameter rows: SET values followed by WHERE parameters
+        """
+        query = _build_update_sql(table_name, tuple(set_columns), where_clause, None)
+        
+        async with self.transaction() as connection:
+            await connection.executemany(query, rows, timeout=self.command_timeout)
+    
     async def delete(
         self,
         table_name: str,
@@ -332,15 +631,7 @@ class DatabaseClient:
         Returns:
             Deleted records if RETURNING specified
         """
-        query_parts = [
-            f"DELETE FROM {table_name}",
-            f"WHERE {where_clause}"
-        ]
-        
-        if returning:
-            query_parts.append(f"RETURNING {returning}")
-        
-        query = " ".join(query_parts)
+        query = _build_delete_sql(table_name, where_clause, returning)
         
         # Execute query
         if returning:
@@ -349,8 +640,32 @@ class DatabaseClient:
             await self.execute(query, *(where_params or []))
             return None
     
+    def invalidate_schema_cache(self, table_name: Optional[str] = None):
+        """
+        Drop cached table metadata.
+        
+        Args:
+            table_name: Table to forget, optionally schema-qualified (all
+                tables if not specified)
+        """
+        if table_name is None:
+            self._schema_cache.clear()
+            return
+        
+        schema, _, name = table_name.lower().rpartition('.')
+        stale = [
+            key for key in self._schema_cache
+            if key[2].lower() == name and (not schema or key[1].lower() == schema)
+        ]
+        for key in stale:
+            self._schema_cache.pop(key, None)
+    
     async def table_exists(self, table_name: str, schema: str = "public") -> bool:
-        """Check if a table exists"""
+        """Check if a table exists (a positive answer is cached for 60 seconds)"""
+        key = ("exists", schema, table_name)
+        if self._schema_cache.get(key):
+            return True
+        
         query = """
             SELECT EXISTS (
                 SELECT FROM information_schema.tables 
@@ -358,36 +673,49 @@ class DatabaseClient:
                 AND table_name = $2
             )
         """
-        return await self.fetchval(query, schema, table_name)
+        exists = await self.fetchval(query, schema, table_name)
+        # Tables can appear at any time (other processes, raw migrations),
+        # so absence is never cached
+        if exists:
+            self._schema_cache[key] = True
+        return exists
     
     async def get_table_columns(
         self,
         table_name: str,
         schema: str = "public"
     ) -> List[Dict[str, Any]]:
-        """Get column information for a table"""
+        """
+        Get column information for a table (cached for 60 seconds once the
+        table exists).
+        
+        Returns a fresh list on every call, so callers may modify it.
+        """
+        key = ("columns", schema, table_name)
+        cached = self._schema_cache.get(key)
+        if cached is not None:
+            return [dict(column) for column in cached]
+        
         query = """
-            SELECT 
-                column_name,
-                data_type,
-                is_nullable,
-                column_default
-            FROM information_schema.columns
-            WHERE table_schema = $1
-            AND table_name = $2
-            ORDER BY ordinal_position
+            SELECT
+                a.attname,
+                format_type(a.atttypid, a.atttypmod),
+                NOT a.attnotnull,
+                pg_get_expr(d.adbin, d.adrelid)
+            FROM pg_catalog.pg_attribute a
+            LEFT JOIN pg_catalog.pg_attrdef d
+                ON d.adrelid = a.attrelid AND d.adnum = a.attnum
+            WHERE a.attrelid = to_regclass(quote_ident($1) || '.' || quote_ident($2))
+            AND a.attnum > 0
+            AND NOT a.attisdropped
+            ORDER BY a.attnum
         """
         rows = await self.fetch(query, schema, table_name)
         
-        return [
-            {
-                "name": row["column_name"],
-                "type": row["data_type"],
-                "nullable": row["is_nullable"] == "YES",
-                "default": row["column_default"]
-            }
-            for row in rows
-        ]
+        columns = [dict(zip(_COLUMN_INFO_KEYS, row)) for row in rows]
+        if columns:
+            self._schema_cache[key] = columns
+        return [dict(column) for column in columns]
     
     async def copy_from_csv(
         self,
@@ -401,32 +729,40 @@ class DatabaseClient:
         Copy data from CSV file using COPY command.
         
         Args:
-            table_name: Target table
+            table_name: Target table, optionally schema-qualified
             file_path: Path to CSV file
             columns: Column names (if not specified, uses table order)
             delimiter: CSV delimiter
             header: Whether CSV has header row
         """
+        schema, _, name = _fold_ident(table_name).rpartition('.')
+        if columns is not None:
+            columns = [_fold_ident(column) for column in columns]
+        
         async with self.acquire() as connection:
-            columns_clause = f"({', '.join(columns)})" if columns else ""
-            header_clause = "HEADER" if header else ""
-            
-            query = f"""
-                COPY {table_name} {columns_clause}
-                FROM STDIN
-                WITH (FORMAT CSV, DELIMITER '{delimiter}', {header_clause})
-            """
-            
-            with open(file_path, 'r') as f:
-                await connection.copy_from_query(query, f.read())
+            # asyncpg streams the file to the server in chunks
+            await connection.copy_to_table(
+                name,
+                source=file_path,
+                columns=columns,
+                schema_name=schema or None,
+                format='csv',
+                delimiter=delimiter,
+                header=header,
+                timeout=self.command_timeout
+            )
             
             logger.info(f"Data copied from {file_path} to {table_name}")
     
     async def health_check(self) -> Dict[str, Any]:
         """Perform database health check"""
         try:
-            # Check connection
-            version = await self.fetchval("SELECT version()")
+            # Independent probes, each on its own pool connection
+            version, active_connections, locks = await asyncio.gather(
+                self.fetchval("SELECT version()"),
+                self.fetchval("SELECT count(*) FROM pg_stat_activity"),
+                self.fetchval("SELECT count(*) FROM pg_locks")
+            )
             
             # Check pool status
             pool_status = {
@@ -439,8 +775,10 @@ class DatabaseClient:
             return {
                 "status": "healthy",
                 "version": version,
+                "active_connections": active_connections,
+                "locks": locks,
                 "pool": pool_status,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_now_iso()
             }
             
         except Exception as e:
@@ -448,5 +786,5 @@ class DatabaseClient:
             return {
                 "status": "unhealthy",
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_now_iso()
             }
\ No newline at end of file
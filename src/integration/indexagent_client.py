@@ -1,26 +1,42 @@
 """IndexAgent API client implementation."""
 
-from typing import Any, Dict, List, Optional
-from .base import ServiceClient
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional
+from .base import BatchingMixin, ServiceClient
 
 
-class IndexAgentClient(ServiceClient):
+class IndexAgentClient(BatchingMixin, ServiceClient):
     """Client for IndexAgent API communication.
     
     Provides methods for:
     - Agent management (create, list, get, delete)
     - Evolution operations (population, generation, metrics)
     - Code search functionality
+    
+    Read endpoints (agents, patterns, metrics) go through ServiceClient's
+    ETag cache; writes drop cached reads of the written path and its
+    collection, and population, generation and pattern writes also drop
+    cached agent reads.
     """
     
-    def __init__(self, base_url: str = "http://localhost:8081", **kwargs):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8081",
+        batch_agent_reads: bool = False,
+        **kwargs
+    ):
         """Initialize IndexAgent client.
         
         Args:
             base_url: IndexAgent API base URL
+            batch_agent_reads: Coalesce concurrent ``get_agent`` calls into
+                ``GET /agents?ids=...`` (requires server support)
             **kwargs: Additional arguments for ServiceClient
         """
         super().__init__(base_url, "IndexAgent", **kwargs)
+        
+        self.batch_agent_reads = batch_agent_reads
+        self._init_batching()
     
     async def health_check(self) -> Dict[str, Any]:
         """Check IndexAgent service health.
@@ -37,6 +53,7 @@ class IndexAgentClient(ServiceClient):
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         agent_type: Optional[str] = None,
+        fields: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """List all agents in the system.
         
@@ -44,6 +61,8 @@ class IndexAgentClient(ServiceClient):
             limit: Maximum number of agents to return
             offset: Number of agents to skip
             agent_type: Filter by agent type
+            fields: Only return these agent fields (e.g. ``["id"]``);
+                servers without projection support return full records
             
         Returns:
             List of agent configurations
@@ -55,9 +74,45 @@ class IndexAgentClient(ServiceClient):
             params['offset'] = offset
         if agent_type:
             params['type'] = agent_type
+        if fields:
+            params['fields'] = ','.join(fields)
             
         return await self.get("/agents", params=params)
     
+    async def aiter_agents(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        agent_type: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over agents as they are received.
+        
+        Streaming variant of ``list_agents`` for large listings.
+        
+        Args:
+            limit: Maximum number of agents to return
+            offset: Number of agents to skip
+            agent_type: Filter by agent type
+            fields: Only return these agent fields (e.g. ``["id"]``);
+                servers without projection support return full records
+            
+        Yields:
+            Agent configurations
+        """
+        params = {}
+        if limit is not None:
+            params['limit'] = limit
+        if offset is not None:
+            params['offset'] = offset
+        if agent_type:
+            params['type'] = agent_type
+        if fields:
+            params['fields'] = ','.join(fields)
+        
+        async for agent in self.aiter_get("/agents", params=params):
+            yield agent
+    
     async def create_agent(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new agent.
         
@@ -81,8 +136,21 @@ class IndexAgentClient(ServiceClient):
         Returns:
             Agent configuration and status
         """
+        if self.batch_agent_reads:
+            return await self._batched_get("/agents", agent_id)
         return await self.get(f"/agents/{agent_id}")
     
+    async def get_agents_bulk(self, agent_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get details for several agents concurrently.
+        
+        Args:
+            agent_ids: Unique agent identifiers
+            
+        Returns:
+            Agent configurations, in the order of ``agent_ids``
+        """
+        return list(await asyncio.gather(*(self.get_agent(agent_id) for agent_id in agent_ids)))
+    
     async def update_agent(self, agent_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
         """Update agent configuration.
         
@@ -129,7 +197,10 @@ class IndexAgentClient(ServiceClient):
             "agent_type": agent_type,
             "config": config or {},
         }
-        return await self.post("/evolution/population", json=payload)
+        result = await self.post("/evolution/population", json=payload)
+        # Creates or modifies agents, which live outside this path
+        self.invalidate_get_cache("/agents")
+        return result
     
     async def trigger_generation(
         self,
@@ -149,7 +220,10 @@ class IndexAgentClient(ServiceClient):
             "population_id": population_id,
             "config": generation_config or {},
         }
-        return await self.post("/evolution/generation", json=payload)
+        result = await self.post("/evolution/generation", json=payload)
+        # Creates or modifies agents, which live outside this path
+        self.invalidate_get_cache("/agents")
+        return result
     
     async def get_evolution_metrics(
         self,
@@ -281,4 +355,7 @@ class IndexAgentClient(ServiceClient):
             "pattern_id": pattern_id,
             "target_agents": target_agents,
         }
-        return await self.post("/patterns/apply", json=payload)
\ No newline at end of file
+        result = await self.post("/patterns/apply", json=payload)
+        # Creates or modifies agents, which live outside this path
+        self.invalidate_get_cache("/agents")
+        return result
\ No newline at end of file
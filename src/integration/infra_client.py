@@ -1,9 +1,17 @@
 """Infrastructure service clients implementation."""
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional
 from datetime import datetime
+
+import aiohttp
+import orjson
+
 from .base import ServiceClient
 
+logger = logging.getLogger(__name__)
+
 
 class EvolutionAPIClient(ServiceClient):
     """Client for Evolution API communication.
@@ -17,10 +25,16 @@ class EvolutionAPIClient(ServiceClient):
     def __init__(self, base_url: str = "http://localhost:8090", **kwargs):
         """Initialize Evolution API client.
         
+        Every call, including the frequent status polls, goes over one
+        keep-alive connection pool that is opened on first use and kept
+        until ``close()``. Pass ``session=`` to share a pool with other
+        clients.
+        
         Args:
             base_url: Evolution API base URL
             **kwargs: Additional arguments for ServiceClient
         """
+        kwargs.setdefault("pool_size", 32)
         super().__init__(base_url, "EvolutionAPI", **kwargs)
     
     async def health_check(self) -> Dict[str, Any]:
@@ -79,6 +93,44 @@ class EvolutionAPIClient(ServiceClient):
             endpoint += f"?trial_id={trial_id}"
         return await self.get(endpoint)
     
+    async def stream_evolution_status(
+        self,
+        trial_id: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream evolution status updates over server-sent events.
+        
+        Opens one long-lived GET to ``/evolution/status:stream`` and yields
+        each status the server pushes, instead of polling
+        ``get_evolution_status``. The stream ends when the server closes it.
+        
+        Args:
+            trial_id: Specific trial ID (or current if None)
+            
+        Yields:
+            Evolution status dicts as generations progress
+        """
+        url = f"{self.base_url}/evolution/status:stream"
+        kwargs: Dict[str, Any] = {
+            'headers': {'Accept': "text/event-stream"},
+            # The stream lives as long as the trial; only bound the connect
+            'timeout': aiohttp.ClientTimeout(total=None, sock_connect=self.timeout.total),
+        }
+        if trial_id:
+            kwargs['params'] = {'trial_id': trial_id}
+        self._apply_headers(kwargs)
+        
+        try:
+            session = await self._get_session()
+            async with session.get(url, **kwargs) as response:
+                if response.status >= 400:
+                    raise self._status_error(response.status, None)
+                
+                async for line in response.content:
+                    if line.startswith(b"data:"):
+                        yield orjson.loads(line[5:])
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            raise self._client_error(e, url) from e
+    
     async def stop_evolution(self, trial_id: Optional[str] = None) -> Dict[str, Any]:
         """Stop the current evolution cycle.
         
@@ -188,6 +240,65 @@ class EvolutionAPIClient(ServiceClient):
             
         return await self.post("/patterns/evaluate", json=payload)
     
+    async def apply_patterns_batch(
+        self,
+        pattern_ids: List[str],
+        target_populations: List[str],
+        max_batch: int = 64,
+    ) -> List[Dict[str, Any]]:
+        """Apply patterns to several populations in batched requests.
+        
+        Args:
+            pattern_ids: List of pattern IDs to apply
+            target_populations: Target population IDs
+            max_batch: Maximum populations per request
+            
+        Returns:
+            Pattern application results, in the order of ``target_populations``
+        """
+        items = [
+            {"pattern_ids": pattern_ids, "target_population": population}
+            for population in target_populations
+        ]
+        return await self._post_batched("/patterns/apply:batch", items, max_batch)
+    
+    async def evaluate_patterns_batch(
+        self,
+        pattern_ids: List[str],
+        test_agents: Optional[List[str]] = None,
+        max_batch: int = 64,
+    ) -> List[Dict[str, Any]]:
+        """Evaluate several patterns in batched requests.
+        
+        Args:
+            pattern_ids: Patterns to evaluate
+            test_agents: Specific agents to test on
+            max_batch: Maximum patterns per request
+            
+        Returns:
+            Pattern evaluation metrics, in the order of ``pattern_ids``
+        """
+        items = []
+        for pattern_id in pattern_ids:
+            item = {"pattern_id": pattern_id}
+            if test_agents:
+                item['test_agents'] = test_agents
+            items.append(item)
+        return await self._post_batched("/patterns/evaluate:batch", items, max_batch)
+    
+    async def _post_batched(
+        self,
+        endpoint: str,
+        items: List[Dict[str, Any]],
+        max_batch: int,
+    ) -> List[Dict[str, Any]]:
+        """POST items in chunks of ``max_batch`` and join the ordered results."""
+        responses = await asyncio.gather(*(
+            self.post(endpoint, json={"items": items[start:start + max_batch]})
+            for start in range(0, len(items), max_batch)
+        ))
+        return [result for response in responses for result in response["results"]]
+    
     # Meta-Learning Operations
     
     async def extract_strategies(
@@ -244,12 +355,21 @@ class EvolutionAPIClient(ServiceClient):
         Returns:
             Metrics in requested format
         """
-        headers = {}
-        if format == "prometheus":
-            headers['Accept'] = "text/plain"
+        if format != "prometheus":
+            return str(await self.get("/metrics"))
         
-        response = await self._request('GET', "/metrics", headers=headers)
-        return response if isinstance(response, str) else str(response)
+        # Prometheus text is not JSON, so read it straight off the shared session
+        url = f"{self.base_url}/metrics"
+        kwargs: Dict[str, Any] = {'headers': {'Accept': "text/plain"}}
+        self._apply_headers(kwargs)
+        try:
+            session = await self._get_session()
+            async with session.get(url, **kwargs) as response:
+                if response.status >= 400:
+                    raise self._status_error(response.status, None)
+                return await response.text()
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            raise self._client_error(e, url) from e
     
     async def get_trial_history(
         self,
@@ -330,32 +450,60 @@ class InfrastructureClient:
             self.monitoring = MonitoringClient(
                 service_name=service_name,
                 pushgateway_url=pushgateway_url,
-                custom_labels=kwargs.get("custom_labels", {})
+                custom_labels=kwargs.get("custom_labels", {}),
+                session=self.evolution.session
             )
     
     async def connect_all(self):
-        """Connect all configured clients."""
+        """Connect all configured clients concurrently.
+        
+        Raises:
+            Exception: The first failure, after every client has been attempted
+        """
+        names, tasks = [], []
         if self.database:
-            await self.database.connect()
+            names.append("database")
+            tasks.append(self.database.connect())
         
         if self.cache:
-            await self.cache.connect()
+            names.append("cache")
+            tasks.append(self.cache.connect())
         
         if self.monitoring:
-            await self.monitoring.start()
+            names.append("monitoring")
+            tasks.append(self.monitoring.start())
+        
+        errors = self._log_failures("connect", names, await asyncio.gather(*tasks, return_exceptions=True))
+        if errors:
+            raise errors[0]
     
     async def close(self):
-        """Close all client connections."""
-        await self.evolution.close()
+        """Close all client connections concurrently."""
+        names, tasks = ["evolution"], [self.evolution.close()]
         
         if self.database:
-            await self.database.disconnect()
+            names.append("database")
+            tasks.append(self.database.disconnect())
         
         if self.cache:
-            await self.cache.disconnect()
+            names.append("cache")
+            tasks.append(self.cache.disconnect())
         
         if self.monitoring:
-            await self.monitoring.stop()
+            names.append("monitoring")
+            tasks.append(self.monitoring.stop())
+        
+        self._log_failures("close", names, await asyncio.gather(*tasks, return_exceptions=True))
+    
+    @staticmethod
+    def _log_failures(action: str, names: List[str], results: List[Any]) -> List[BaseException]:
+        """Log each failed slot of a gather() by client name and return the errors."""
+        errors = []
+        for name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to {action} {name} client: {result}")
+                errors.append(result)
+        return errors
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -4,19 +4,26 @@ Monitoring Client for DEAN Infrastructure
 Provides metrics export, alerting, and monitoring capabilities
 """
 
+import ast
+import base64
 import time
 import asyncio
-from typing import Dict, Any, List, Optional, Union, Callable
-from datetime import datetime, timedelta
+from typing import Dict, Any, Iterable, List, Mapping, Optional, Tuple, Union, Callable
 from collections import defaultdict
+from types import MappingProxyType
+from urllib.parse import quote_plus
 import logging
+import aiohttp
 from prometheus_client import (
     Counter, Gauge, Histogram, Summary,
     CollectorRegistry, generate_latest,
-    push_to_gateway, REGISTRY
+    push_to_gateway, CONTENT_TYPE_LATEST
 )
 from prometheus_client.core import Metric
 
+from .base import LazySession
+from .timestamps import utc_now_iso
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,6 +35,80 @@ class MetricType:
     SUMMARY = "summary"
 
 
+def _grouping_path(job: str, grouping_key: Dict[str, str]) -> str:
+    """Build the pushgateway URL path for a job and grouping key.
+    
+    Values are escaped the way ``prometheus_client.push_to_gateway`` does:
+    URL-quoted, or base64 when they are empty or contain a slash.
+    """
+    parts = []
+    for key, value in (("job", job), *grouping_key.items()):
+        value = str(value)
+        if not value or "/" in value:
+            key = f"{key}@base64"
+            value = base64.urlsafe_b64encode(value.encode()).decode() or "="
+        else:
+            value = quote_plus(value)
+        parts.append(f"/{key}/{value}")
+    return "/metrics" + "".join(parts)
+
+
+# Syntax allowed in alert expressions besides metric references
+_ALERT_EXPR_NODES = (
+    ast.Expression, ast.BoolOp, ast.And, ast.Or, ast.UnaryOp, ast.Not,
+    ast.USub, ast.UAdd, ast.BinOp, ast.Add, ast.Sub, ast.Mult, ast.Div,
+    ast.Mod, ast.Compare, ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt,
+    ast.GtE, ast.Constant, ast.Load,
+)
+
+
+class _AlertExprCompiler(ast.NodeTransformer):
+    """Rewrite metric references in an alert expression into value getters.
+    
+    ``name`` and ``name(label="value", ...)`` become calls to the bound
+    ``_value.get`` of the metric (child), so the compiled condition does no
+    metric lookups when it runs.
+    """
+    
+    def __init__(self, resolve: Callable[[str, Optional[Dict[str, str]]], Callable[[], float]]):
+        self.resolve = resolve
+        self.namespace: Dict[str, Any] = {"__builtins__": {}, "bool": bool}
+    
+    def compile(self, expr: str) -> Callable[[], bool]:
+        tree = self.visit(ast.parse(expr, mode="eval"))
+        lam = ast.Expression(ast.Lambda(
+            ast.arguments(posonlyargs=[], args=[], kwonlyargs=[], kw_defaults=[], defaults=[]),
+            ast.Call(ast.Name("bool", ast.Load()), [tree.body], [])
+        ))
+        code = compile(ast.fix_missing_locations(lam), f"<alert: {expr}>", "eval")
+        return eval(code, self.namespace)
+    
+    def _ref(self, node: ast.AST, name: str, labels: Optional[Dict[str, str]]) -> ast.AST:
+        ref = f"_m{len(self.namespace)}"
+        self.namespace[ref] = self.resolve(name, labels)
+        return ast.copy_location(ast.Call(ast.Name(ref, ast.Load()), [], []), node)
+    
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        return self._ref(node, node.id, None)
+    
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        if (not isinstance(node.func, ast.Name) or node.args
+                or any(k.arg is None or not isinstance(k.value, ast.Constant) for k in node.keywords)):
+            raise ValueError("Metric references take only label=\"value\" arguments")
+        labels = {k.arg: str(k.value.value) for k in node.keywords}
+        return self._ref(node, node.func.id, labels)
+    
+    def visit_Constant(self, node: ast.Constant) -> ast.AST:
+        if not isinstance(node.value, (int, float)):
+            raise ValueError(f"Unsupported constant in alert expression: {node.value!r}")
+        return node
+    
+    def generic_visit(self, node: ast.AST) -> ast.AST:
+        if not isinstance(node, _ALERT_EXPR_NODES):
+            raise ValueError(f"Unsupported syntax in alert expression: {type(node).__name__}")
+        return super().generic_visit(node)
+
+
 class MonitoringClient:
     """
     Monitoring client for DEAN system.
@@ -39,7 +120,8 @@ class MonitoringClient:
         service_name: str,
         pushgateway_url: Optional[str] = None,
         push_interval: int = 60,
-        custom_labels: Optional[Dict[str, str]] = None
+        custom_labels: Optional[Dict[str, str]] = None,
+        session: Optional[Union[aiohttp.ClientSession, LazySession]] = None
     ):
         """
         Initialize monitoring client.
@@ -49,22 +131,39 @@ class MonitoringClient:
             pushgateway_url: URL of Prometheus pushgateway
             push_interval: Interval to push metrics (seconds)
             custom_labels: Additional labels for all metrics
+            session: HTTP session (or LazySession) to push metrics over,
+                e.g. one shared with service clients; a small one is
+                created on first push when omitted
         """
         self.service_name = service_name
         self.pushgateway_url = pushgateway_url
         self.push_interval = push_interval
         self.custom_labels = custom_labels or {}
+        self._custom_labels_ro = MappingProxyType(self.custom_labels)
         
-        # Metric storage
+        # Metric storage; a private registry keeps pushes and exposition
+        # limited to this client's metrics
+        self.registry = CollectorRegistry()
         self.metrics: Dict[str, Metric] = {}
-        self.custom_metrics: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self._by_short: Dict[str, Metric] = {}
+        self._child_cache: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Any] = {}
+        self.custom_metrics: Dict[str, Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float]] = defaultdict(dict)
         
         # Alert rules
         self.alert_rules: List[Dict[str, Any]] = []
-        self.alert_handlers: List[Callable] = []
+        self.alert_handlers: List[Tuple[Callable, bool]] = []  # (handler, is_async)
+        
+        # Pushgateway transport
+        self._owns_session = session is None
+        self._session = session or LazySession(timeout=10, pool_size=4)
+        self._push_url = None
+        if pushgateway_url:
+            base_url = pushgateway_url if "://" in pushgateway_url else f"http://{pushgateway_url}"
+            self._push_url = base_url.rstrip("/") + _grouping_path(service_name, self.custom_labels)
         
         # Background tasks
         self._push_task: Optional[asyncio.Task] = None
+        self._dirty = True  # metrics changed since the last push
         self._alert_task: Optional[asyncio.Task] = None
         
         # Initialize default metrics
@@ -139,10 +238,12 @@ class MonitoringClient:
         metric = Counter(
             full_name,
             description,
-            all_labels
+            all_labels,
+            registry=self.registry
         )
         
         self.metrics[full_name] = metric
+        self._by_short[name] = metric
         return metric
     
     def create_gauge(
@@ -164,10 +265,12 @@ class MonitoringClient:
         metric = Gauge(
             full_name,
             description,
-            all_labels
+            all_labels,
+            registry=self.registry
         )
         
         self.metrics[full_name] = metric
+        self._by_short[name] = metric
         return metric
     
     def create_histogram(
@@ -191,10 +294,12 @@ class MonitoringClient:
             full_name,
             description,
             all_labels,
-            buckets=buckets
+            buckets=buckets or Histogram.DEFAULT_BUCKETS,
+            registry=self.registry
         )
         
         self.metrics[full_name] = metric
+        self._by_short[name] = metric
         return metric
     
     def create_summary(
@@ -216,10 +321,12 @@ class MonitoringClient:
         metric = Summary(
             full_name,
             description,
-            all_labels
+            all_labels,
+            registry=self.registry
         )
         
         self.metrics[full_name] = metric
+        self._by_short[name] = metric
         return metric
     
     # Metric recording methods
@@ -231,18 +338,7 @@ class MonitoringClient:
         labels: Optional[Dict[str, str]] = None
     ):
         """Increment a counter metric"""
-        full_name = f"{self.service_name}_{name}"
-        
-        if full_name not in self.metrics:
-            raise ValueError(f"Metric {name} not found")
-        
-        metric = self.metrics[full_name]
-        label_values = self._get_label_values(labels)
-        
-        if label_values:
-            metric.labels(**label_values).inc(value)
-        else:
-            metric.inc(value)
+        self._child(name, labels).inc(value)
     
     def set_gauge(
         self,
@@ -251,18 +347,7 @@ class MonitoringClient:
         labels: Optional[Dict[str, str]] = None
     ):
         """Set a gauge metric value"""
-        full_name = f"{self.service_name}_{name}"
-        
-        if full_name not in self.metrics:
-            raise ValueError(f"Metric {name} not found")
-        
-        metric = self.metrics[full_name]
-        label_values = self._get_label_values(labels)
-        
-        if label_values:
-            metric.labels(**label_values).set(value)
-        else:
-            metric.set(value)
+        self._child(name, labels).set(value)
     
     def observe_histogram(
         self,
@@ -271,18 +356,7 @@ class MonitoringClient:
         labels: Optional[Dict[str, str]] = None
     ):
         """Observe a histogram metric value"""
-        full_name = f"{self.service_name}_{name}"
-        
-        if full_name not in self.metrics:
-            raise ValueError(f"Metric {name} not found")
-        
-        metric = self.metrics[full_name]
-        label_values = self._get_label_values(labels)
-        
-        if label_values:
-            metric.labels(**label_values).observe(value)
-        else:
-            metric.observe(value)
+        self._child(name, labels).observe(value)
     
     def time_histogram(
         self,
@@ -290,18 +364,7 @@ class MonitoringClient:
         labels: Optional[Dict[str, str]] = None
     ):
         """Context manager to time operations with histogram"""
-        full_name = f"{self.service_name}_{name}"
-        
-        if full_name not in self.metrics:
-            raise ValueError(f"Metric {name} not found")
-        
-        metric = self.metrics[full_name]
-        label_values = self._get_label_values(labels)
-        
-        if label_values:
-            return metric.labels(**label_values).time()
-        else:
-            return metric.time()
+        return self._child(name, labels).time()
     
     # Custom metrics
     
@@ -313,8 +376,7 @@ class MonitoringClient:
         tags: Optional[Dict[str, str]] = None
     ):
         """Record a custom metric"""
-        key = f"{name}:{self._tags_to_string(tags)}"
-        self.custom_metrics[metric_type][key] = value
+        self.custom_metrics[metric_type][(name, self._tags_key(tags))] = value
     
     def get_custom_metric(
         self,
@@ -323,8 +385,7 @@ class MonitoringClient:
         tags: Optional[Dict[str, str]] = None
     ) -> Optional[float]:
         """Get a custom metric value"""
-        key = f"{name}:{self._tags_to_string(tags)}"
-        return self.custom_metrics[metric_type].get(key)
+        return self.custom_metrics[metric_type].get((name, self._tags_key(tags)))
     
     # Alert rules
     
@@ -349,15 +410,47 @@ class MonitoringClient:
         self.alert_rules.append({
             "name": name,
             "condition": condition,
+            "is_async": asyncio.iscoroutinefunction(condition),
             "message": message,
             "severity": severity,
             "cooldown": cooldown,
             "last_fired": None
         })
     
+    def add_alert_rule_expr(
+        self,
+        name: str,
+        expr: str,
+        message: str,
+        severity: str = "warning",
+        cooldown: int = 300
+    ):
+        """
+        Add an alert rule from an expression over counter and gauge values.
+        
+        The expression is parsed and compiled once; metric references are
+        bound to their value objects, so each check is a single call.
+        
+        Example:
+            ``errors_total(error_type="db", component="api") > 10 or active_connections(connection_type="ws") > 500``
+        
+        Args:
+            name: Alert name
+            expr: Comparison over metric short names, numbers and
+                ``and``/``or``/``not``/arithmetic
+            message: Alert message
+            severity: Alert severity (info, warning, error, critical)
+            cooldown: Cooldown period in seconds
+        
+        Raises:
+            ValueError: If the expression uses unsupported syntax or metrics
+        """
+        condition = _AlertExprCompiler(self._metric_value_getter).compile(expr)
+        self.add_alert_rule(name, condition, message, severity, cooldown)
+    
     def add_alert_handler(self, handler: Callable[[Dict[str, Any]], None]):
         """Add an alert handler"""
-        self.alert_handlers.append(handler)
+        self.alert_handlers.append((handler, asyncio.iscoroutinefunction(handler)))
     
     async def check_alerts(self):
         """Check alert rules and fire alerts"""
@@ -371,7 +464,7 @@ class MonitoringClient:
             
             # Check condition
             try:
-                if asyncio.iscoroutinefunction(rule["condition"]):
+                if rule["is_async"]:
                     should_alert = await rule["condition"]()
                 else:
                     should_alert = rule["condition"]()
@@ -382,14 +475,14 @@ class MonitoringClient:
                         "name": rule["name"],
                         "message": rule["message"],
                         "severity": rule["severity"],
-                        "timestamp": datetime.utcnow().isoformat(),
+                        "timestamp": utc_now_iso(),
                         "service": self.service_name
                     }
                     
                     # Call handlers
-                    for handler in self.alert_handlers:
+                    for handler, is_async in self.alert_handlers:
                         try:
-                            if asyncio.iscoroutinefunction(handler):
+                            if is_async:
                                 await handler(alert)
                             else:
                                 handler(alert)
@@ -429,13 +522,34 @@ class MonitoringClient:
                 await self._alert_task
             except asyncio.CancelledError:
                 pass
+        
+        if self._owns_session:
+            await self._session.close()
     
     async def _push_metrics_loop(self):
-        """Background loop to push metrics"""
+        """Background loop to push metrics on a fixed schedule.
+        
+        Deadlines are absolute so push time does not accumulate as drift,
+        pushes go over the async session, and nothing is pushed when no
+        metric was recorded since the previous push.
+        """
+        loop = asyncio.get_running_loop()
+        next_t = loop.time()
         while True:
             try:
-                await asyncio.sleep(self.push_interval)
-                self.push_metrics()
+                next_t += self.push_interval
+                now = loop.time()
+                if next_t < now:
+                    # A push overran whole intervals; skip the missed ticks
+                    next_t = now + self.push_interval
+                await asyncio.sleep(next_t - now)
+                
+                if self._dirty:
+                    # Cleared before the push so updates made while it is in
+                    # flight are kept; restored if the push fails
+                    self._dirty = False
+                    if not await self._push_async():
+                        self._dirty = True
             except Exception as e:
                 logger.error(f"Error pushing metrics: {e}")
     
@@ -459,37 +573,96 @@ class MonitoringClient:
             push_to_gateway(
                 self.pushgateway_url,
                 job=self.service_name,
-                registry=REGISTRY,
+                registry=self.registry,
                 grouping_key=self.custom_labels
             )
             logger.debug("Metrics pushed to gateway")
         except Exception as e:
             logger.error(f"Failed to push metrics: {e}")
     
+    async def _push_async(self) -> bool:
+        """Push metrics to the pushgateway without blocking the event loop.
+        
+        Same semantics as ``push_metrics`` (a PUT replacing this job's
+        group), sent over the client's aiohttp session. Run the service
+        under uvloop (``integration.enable_uvloop()``) for a faster loop.
+        
+        Returns:
+            False if the push failed
+        """
+        if not self._push_url:
+            return True
+        
+        try:
+            if isinstance(self._session, LazySession):
+                session = await self._session.get()
+            else:
+                session = self._session
+            async with session.put(
+                self._push_url,
+                data=generate_latest(self.registry),
+                headers={"Content-Type": CONTENT_TYPE_LATEST}
+            ) as response:
+                if response.status >= 400:
+                    raise aiohttp.ClientResponseError(
+                        response.request_info, response.history,
+                        status=response.status, message=await response.text()
+                    )
+            logger.debug("Metrics pushed to gateway")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to push metrics: {e}")
+            return False
+    
     def get_metrics_text(self) -> str:
         """Get metrics in Prometheus text format"""
-        return generate_latest(REGISTRY).decode('utf-8')
+        return generate_latest(self.registry).decode('utf-8')
     
     # Utility methods
     
     def _get_label_values(
         self,
         labels: Optional[Dict[str, str]] = None
-    ) -> Dict[str, str]:
-        """Get combined label values"""
-        result = dict(self.custom_labels)
+    ) -> Mapping[str, str]:
+        """Get combined label values (a read-only view when there are no extra labels)"""
+        if not labels:
+            return self._custom_labels_ro
         
-        if labels:
-            result.update(labels)
-        
-        return result
+        return {**self.custom_labels, **labels}
     
-    def _tags_to_string(self, tags: Optional[Dict[str, str]] = None) -> str:
-        """Convert tags to string for key"""
-        if not tags:
-            return ""
+    def _child(self, name: str, labels: Optional[Dict[str, str]] = None):
+        """Get the metric child bound to a label combination, caching it.
         
-        return ",".join(f"{k}={v}" for k, v in sorted(tags.items()))
+        Every recording path goes through here, so this also marks the
+        metrics as changed for the push loop.
+        """
+        self._dirty = True
+        key = (name, self._tags_key(labels))
+        child = self._child_cache.get(key)
+        if child is None:
+            metric = self._by_short.get(name)
+            if metric is None:
+                raise ValueError(f"Metric {name} not found")
+            
+            label_values = self._get_label_values(labels)
+            child = metric.labels(**label_values) if label_values else metric
+            self._child_cache[key] = child
+        return child
+    
+    def _metric_value_getter(
+        self,
+        name: str,
+        labels: Optional[Dict[str, str]] = None
+    ) -> Callable[[], float]:
+        """Get the bound value reader of a counter or gauge (child)"""
+        value = getattr(self._child(name, labels), "_value", None)
+        if value is None:
+            raise ValueError(f"Metric {name} has no single value to alert on")
+        return value.get
+    
+    def _tags_key(self, tags: Optional[Dict[str, str]] = None) -> Tuple[Tuple[str, str], ...]:
+        """Convert tags to a hashable key"""
+        return tuple(sorted(tags.items())) if tags else ()
     
     # Common metric helpers
     
@@ -501,14 +674,14 @@ class MonitoringClient:
         duration: float
     ):
         """Record HTTP request metrics"""
-        labels = {"method": method, "endpoint": endpoint, "status": str(status)}
-        
-        self.increment_counter("requests_total", labels=labels)
-        self.observe_histogram(
+        self._child(
+            "requests_total",
+            {"method": method, "endpoint": endpoint, "status": str(status)}
+        ).inc()
+        self._child(
             "request_duration_seconds",
-            duration,
-            labels={"method": method, "endpoint": endpoint}
-        )
+            {"method": method, "endpoint": endpoint}
+        ).observe(duration)
     
     def record_error(
         self,
@@ -517,28 +690,35 @@ class MonitoringClient:
         error: Optional[Exception] = None
     ):
         """Record error metrics"""
-        self.increment_counter(
+        self._child(
             "errors_total",
-            labels={"error_type": error_type, "component": component}
-        )
+            {"error_type": error_type, "component": component}
+        ).inc()
         
         if error:
             logger.error(f"Error in {component}: {error_type} - {error}")
     
     def record_agent_created(self, agent_type: str = "default"):
         """Record agent creation"""
-        self.increment_counter(
-            "agents_created_total",
-            labels={"agent_type": agent_type}
-        )
+        self._child("agents_created_total", {"agent_type": agent_type}).inc()
     
     def record_agent_fitness(self, fitness: float, generation: int):
         """Record agent fitness score"""
-        self.observe_histogram(
-            "agent_fitness_score",
-            fitness,
-            labels={"generation": str(generation)}
-        )
+        self._child("agent_fitness_score", {"generation": str(generation)}).observe(fitness)
+    
+    def record_agent_fitness_bulk(
+        self,
+        fitnesses: Iterable[float],
+        generation: int
+    ):
+        """Record the fitness scores of a whole generation at once.
+        
+        The labelled histogram child is resolved once for the generation
+        rather than once per agent.
+        """
+        observe = self._child("agent_fitness_score", {"generation": str(generation)}).observe
+        for fitness in fitnesses:
+            observe(float(fitness))
     
     async def health_check(self) -> Dict[str, Any]:
         """Perform monitoring health check"""
@@ -560,7 +740,7 @@ class MonitoringClient:
                 "custom_metrics": custom_metric_count,
                 "alert_rules": len(self.alert_rules),
                 "pushgateway_healthy": pushgateway_healthy,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_now_iso()
             }
             
         except Exception as e:
@@ -568,5 +748,5 @@ class MonitoringClient:
             return {
                 "status": "unhealthy",
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_now_iso()
             }
\ No newline at end of file
@@ -4,22 +4,151 @@ Redis Cache Client for DEAN Infrastructure
 Provides caching, pub/sub, and distributed locking capabilities
 """
 
-import json
 import asyncio
-from typing import Dict, Any, List, Optional, Union, Callable
-from datetime import datetime, timedelta
-import aioredis
-from aioredis.lock import Lock
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple, Union, Callable
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from uuid import UUID
+from redis import asyncio as aioredis
+from redis.asyncio.client import PubSub
 import logging
-import pickle
+import msgpack
+import orjson
+
+from .timestamps import utc_now_iso
 
 logger = logging.getLogger(__name__)
 
+# SCAN page size and maximum keys per UNLINK when invalidating by pattern
+_SCAN_COUNT = 1000
+_UNLINK_BATCH = 500
+
+# Independent pub/sub connections, each with its own reader, that channels
+# are spread across
+_PUBSUB_SHARDS = 4
+
+# Pub/sub dispatch: messages buffered per channel before the reader blocks.
+# Each channel has a single worker, so its handlers see messages in order
+# and never run concurrently with themselves.
+_DISPATCH_QUEUE_SIZE = 1024
+
+# Deletes a lock only if it still holds the caller's token
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# GET a value; on a miss, try to take the compute lock (KEYS[2]) instead.
+# Returns {_CACHE_HIT, value}, {_CACHE_LOCKED, ''} or {_CACHE_BUSY, ''}.
+_GET_OR_LOCK_SCRIPT = """
+local v = redis.call('get', KEYS[1])
+if v then
+    return {1, v}
+end
+if redis.call('set', KEYS[2], ARGV[1], 'NX', 'PX', ARGV[2]) then
+    return {0, ''}
+end
+return {2, ''}
+"""
+_CACHE_LOCKED, _CACHE_HIT, _CACHE_BUSY = 0, 1, 2
+
+# Marks MessagePack-encoded values. 0x93 is a UTF-8 continuation byte, so
+# no JSON document or text value can start with it.
+_MSGPACK_MAGIC = b"\x93"
+# Every JSON document starts with one of these bytes; anything else is
+# stored text and skips the parse attempt.
+_JSON_FIRST_BYTES = frozenset(b'{["tfn0123456789-')
+
+
+def _default_encoder(value: Any) -> Any:
+    """Encode the non-native types cache values may contain, as text."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    raise TypeError(f"Unsupported cache value type: {type(value)}")
+
+
+def _pack(value: Any) -> bytes:
+    """Encode a container with MessagePack behind the magic prefix."""
+    return _MSGPACK_MAGIC + msgpack.packb(value, use_bin_type=True, default=_default_encoder)
+
+
+def _encode(value: Any) -> Any:
+    """Serialize dicts and lists with MessagePack; pass other values through."""
+    if isinstance(value, (dict, list)):
+        return _pack(value)
+    return value
+
+
+def _serialize_any(value: Any) -> Any:
+    """Serialize a value whose exact type has no entry in _SERIALIZERS."""
+    if isinstance(value, (dict, list, tuple)):
+        return _pack(value)
+    if not isinstance(value, (str, bytes, int, float)):
+        # Dataclasses, numpy arrays, datetimes...; raises TypeError otherwise
+        return orjson.dumps(value, default=_default_encoder, option=orjson.OPT_SERIALIZE_NUMPY)
+    return value
+
+
+def _passthrough(value: Any) -> Any:
+    return value
+
+
+# SET serializers by exact type: one dict lookup on the common types, with
+# subclasses and everything else resolved by _serialize_any
+_SERIALIZERS: Dict[type, Callable[[Any], Any]] = {
+    dict: _pack,
+    list: _pack,
+    tuple: _pack,
+    str: _passthrough,
+    bytes: _passthrough,
+    int: _passthrough,
+    float: _passthrough,
+}
+
+
+def _serialize(value: Any) -> Any:
+    """Serialize a value for SET: MessagePack containers, native scalars, JSON otherwise."""
+    return _SERIALIZERS.get(type(value), _serialize_any)(value)
+
+
+@dataclass(slots=True)
+class RedisLock:
+    """A held distributed lock: its Redis key and the owner token stored there."""
+    name: str
+    token: str
+
+
+class _Disconnected:
+    """Stands in for the Redis client until connect(); any use raises."""
+    
+    __slots__ = ()
+    
+    def __bool__(self) -> bool:
+        return False
+    
+    def __getattr__(self, name: str) -> Any:
+        raise RuntimeError(
+            "RedisCacheClient is not connected; call connect() or use 'async with'"
+        )
+
+
+_NOT_CONNECTED = _Disconnected()
+
 
 class RedisCacheClient:
     """
     Redis cache client for DEAN system.
     Provides caching, pub/sub, and distributed locking.
+    
+    Call ``connect()`` (or enter ``async with``) before use; operations
+    do not connect on demand, so the hot path carries no connection check.
     """
     
     def __init__(
@@ -48,23 +177,50 @@ class RedisCacheClient:
         self.encoding = encoding
         self.decode_responses = decode_responses
         self.max_connections = max_connections
-        self.redis: Optional[aioredis.Redis] = None
-        self.pubsub_handlers: Dict[str, List[Callable]] = {}
+        # Raw bytes, decoded in _decode; a placeholder that raises on use
+        # until connect()
+        self.redis: Union[aioredis.Redis, _Disconnected] = _NOT_CONNECTED
+        self.pubsub_handlers: Dict[str, List[Tuple[Callable, bool]]] = {}  # (handler, is_async)
+        self._connect_lock = asyncio.Lock()
+        self._release_lock_script = None
+        self._get_or_lock_script = None
+        self._pubsubs: List[Optional[PubSub]] = [None] * _PUBSUB_SHARDS
+        self._listener_tasks: List[Optional[asyncio.Task]] = [None] * _PUBSUB_SHARDS
+        self._dispatch_queues: Dict[str, asyncio.Queue] = {}
+        self._dispatch_workers: Dict[str, asyncio.Task] = {}
+        
+        # Fire-and-forget publishing (publish_nowait)
+        self._pub_buffer: List[Tuple[str, Any]] = []
+        self._pub_pending = asyncio.Event()
+        self._pub_lock = asyncio.Lock()
+        self._pub_flusher: Optional[asyncio.Task] = None
         
     async def connect(self):
-        """Establish Redis connection"""
+        """Establish Redis connection (idempotent and safe to call concurrently)"""
         if self.redis:
             return
         
+        async with self._connect_lock:
+            if self.redis:
+                return
+            await self._connect()
+    
+    async def _connect(self):
         try:
-            self.redis = await aioredis.create_redis_pool(
+            # Responses stay raw bytes (decoded in _decode); redis-py picks
+            # the hiredis C parser automatically when it is installed
+            redis = aioredis.Redis.from_url(
                 self.redis_url,
                 db=self.db,
                 password=self.password,
-                encoding=self.encoding,
-                minsize=5,
-                maxsize=self.max_connections
+                max_connections=self.max_connections,
+                decode_responses=False
             )
+            await redis.ping()
+            # Runs via EVALSHA, reloading the script if the server lost it
+            self._release_lock_script = redis.register_script(_RELEASE_LOCK_SCRIPT)
+            self._get_or_lock_script = redis.register_script(_GET_OR_LOCK_SCRIPT)
+            self.redis = redis
             logger.info(f"Connected to Redis at {self.redis_url}")
         except Exception as e:
             logger.error(f"Failed to connect to Redis: {e}")
@@ -72,29 +228,49 @@ class RedisCacheClient:
     
     async def disconnect(self):
         """Close Redis connection"""
+        if self._pub_flusher:
+            # Holding the lock lets an in-flight flush finish first
+            async with self._pub_lock:
+                self._pub_flusher.cancel()
+            await asyncio.gather(self._pub_flusher, return_exceptions=True)
+            self._pub_flusher = None
+        
+        if self.redis and self._pub_buffer:
+            try:
+                await self.flush_publish()
+            except Exception as e:
+                logger.error(f"Failed to flush published messages: {e}")
+        
+        listeners = [task for task in self._listener_tasks if task]
+        for task in listeners:
+            task.cancel()
+        await asyncio.gather(*listeners, return_exceptions=True)
+        self._listener_tasks = [None] * _PUBSUB_SHARDS
+        
+        for channel in list(self._dispatch_workers):
+            await self._stop_dispatch(channel)
+        
+        for pubsub in self._pubsubs:
+            if pubsub:
+                await pubsub.aclose()
+        self._pubsubs = [None] * _PUBSUB_SHARDS
+        
         if self.redis:
-            self.redis.close()
-            await self.redis.wait_closed()
-            self.redis = None
+            await self.redis.aclose()
+            self.redis = _NOT_CONNECTED
             logger.info("Disconnected from Redis")
     
     # Basic cache operations
     
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache"""
-        if not self.redis:
-            await self.connect()
-        
         value = await self.redis.get(key)
         
         if value is None:
             return None
         
         # Try to deserialize JSON
-        try:
-            return json.loads(value)
-        except (json.JSONDecodeError, TypeError):
-            return value
+        return self._decode(value)
     
     async def set(
         self,
@@ -117,254 +293,299 @@ class RedisCacheClient:
         Returns:
             Success status
         """
-        if not self.redis:
-            await self.connect()
+        value = _serialize(value)
         
-        # Serialize value
-        if isinstance(value, (dict, list)):
-            value = json.dumps(value)
-        elif not isinstance(value, (str, bytes, int, float)):
-            value = pickle.dumps(value)
+        if nx and xx:
+            raise ValueError("Cannot specify both nx and xx")
         
-        # Set with options
-        if ttl:
-            return await self.redis.setex(key, ttl, value)
-        else:
-            return await self.redis.set(key, value, exist=self._get_exist_flag(nx, xx))
+        # One SET carries the TTL and the existence condition atomically
+        return bool(await self.redis.set(key, value, ex=ttl or None, nx=nx, xx=xx))
     
     async def delete(self, *keys: str) -> int:
         """Delete keys from cache"""
-        if not self.redis:
-            await self.connect()
-        
         return await self.redis.delete(*keys)
     
     async def exists(self, *keys: str) -> int:
         """Check if keys exist"""
-        if not self.redis:
-            await self.connect()
-        
         return await self.redis.exists(*keys)
     
     async def expire(self, key: str, ttl: int) -> bool:
         """Set TTL for a key"""
-        if not self.redis:
-            await self.connect()
-        
         return await self.redis.expire(key, ttl)
     
     async def ttl(self, key: str) -> int:
         """Get TTL for a key"""
-        if not self.redis:
-            await self.connect()
-        
         return await self.redis.ttl(key)
     
     # Batch operations
     
     async def mget(self, *keys: str) -> List[Optional[Any]]:
         """Get multiple values"""
-        if not self.redis:
-            await self.connect()
-        
         values = await self.redis.mget(*keys)
         
-        # Deserialize values
-        results = []
-        for value in values:
-            if value is None:
-                results.append(None)
-            else:
-                try:
-                    results.append(json.loads(value))
-                except (json.JSONDecodeError, TypeError):
-                    results.append(value)
-        
-        return results
+        return [None if value is None else self._decode(value) for value in values]
     
     async def mset(self, mapping: Dict[str, Any]) -> bool:
         """Set multiple values"""
-        if not self.redis:
-            await self.connect()
+        serialized = {key: _serialize(value) for key, value in mapping.items()}
+        return await self.redis.mset(serialized)
+    
+    def pipeline(self, transaction: bool = False):
+        """
+        Start a command pipeline; commands are sent in one round-trip on execute().
         
-        # Serialize values
-        serialized = {}
-        for key, value in mapping.items():
-            if isinstance(value, (dict, list)):
-                serialized[key] = json.dumps(value)
-            elif not isinstance(value, (str, bytes, int, float)):
-                serialized[key] = pickle.dumps(value)
-            else:
-                serialized[key] = value
+        Requires an established connection (see ``connect``).
         
-        return await self.redis.mset(serialized)
+        Args:
+            transaction: Wrap the commands in MULTI/EXEC
+        """
+        return self.redis.pipeline(transaction=transaction)
+    
+    async def mset_many(
+        self,
+        mapping: Dict[str, Any],
+        ttl: Optional[int] = None,
+        chunk: int = 500
+    ) -> None:
+        """
+        Set many values, optionally with a TTL, one pipeline per chunk.
+        
+        Args:
+            mapping: Keys and values to cache
+            ttl: Time to live in seconds for every key
+            chunk: Commands per pipeline
+        """
+        items = list(mapping.items())
+        for start in range(0, len(items), chunk):
+            pipe = self.redis.pipeline()
+            for key, value in items[start:start + chunk]:
+                pipe.set(key, _serialize(value), ex=ttl)
+            await pipe.execute()
+    
+    async def mget_batched(self, keys: List[str], chunk: int = 1000) -> List[Optional[Any]]:
+        """
+        Get many values with chunked MGETs sent in a single pipeline.
+        
+        Args:
+            keys: Keys to fetch
+            chunk: Keys per MGET
+            
+        Returns:
+            Values in the order of ``keys`` (None for missing keys)
+        """
+        pipe = self.redis.pipeline()
+        for start in range(0, len(keys), chunk):
+            pipe.mget(*keys[start:start + chunk])
+        
+        return [
+            None if value is None else self._decode(value)
+            for values in await pipe.execute()
+            for value in values
+        ]
     
     # Advanced operations
     
     async def incr(self, key: str, amount: int = 1) -> int:
         """Increment a counter"""
-        if not self.redis:
-            await self.connect()
-        
         return await self.redis.incrby(key, amount)
     
     async def decr(self, key: str, amount: int = 1) -> int:
         """Decrement a counter"""
-        if not self.redis:
-            await self.connect()
-        
         return await self.redis.decrby(key, amount)
     
     async def hget(self, key: str, field: str) -> Optional[Any]:
         """Get hash field value"""
-        if not self.redis:
-            await self.connect()
-        
         value = await self.redis.hget(key, field)
         
         if value is None:
             return None
         
-        try:
-            return json.loads(value)
-        except (json.JSONDecodeError, TypeError):
-            return value
+        return self._decode(value)
     
     async def hset(self, key: str, field: str, value: Any) -> int:
         """Set hash field value"""
-        if not self.redis:
-            await self.connect()
-        
-        if isinstance(value, (dict, list)):
-            value = json.dumps(value)
-        
-        return await self.redis.hset(key, field, value)
+        return await self.redis.hset(key, field, _encode(value))
     
     async def hgetall(self, key: str) -> Dict[str, Any]:
-        """Get all hash fields"""
-        if not self.redis:
-            await self.connect()
+        """
+        Get all hash fields.
         
+        The whole hash comes back in one reply; for hashes with more than
+        about 1000 fields prefer ``hscan_iter``.
+        """
         data = await self.redis.hgetall(key)
         
-        # Deserialize values
-        result = {}
-        for field, value in data.items():
-            try:
-                result[field] = json.loads(value)
-            except (json.JSONDecodeError, TypeError):
-                result[field] = value
+        return {self._text(field): self._decode(value) for field, value in data.items()}
+    
+    async def hscan_iter(self, key: str, count: int = 500) -> AsyncIterator[Tuple[Any, Any]]:
+        """
+        Iterate over hash fields page by page with HSCAN.
         
-        return result
+        Args:
+            key: Hash key
+            count: Fields requested per HSCAN page
+            
+        Yields:
+            (field, value) pairs, decoded like ``hgetall``
+        """
+        cursor = 0
+        while True:
+            cursor, batch = await self.redis.hscan(key, cursor, count=count)
+            for field, value in batch.items():
+                yield self._text(field), self._decode(value)
+            
+            if cursor == 0:
+                return
     
     async def lpush(self, key: str, *values: Any) -> int:
         """Push values to list head"""
-        if not self.redis:
-            await self.connect()
-        
-        # Serialize values
-        serialized = []
-        for value in values:
-            if isinstance(value, (dict, list)):
-                serialized.append(json.dumps(value))
-            else:
-                serialized.append(value)
-        
-        return await self.redis.lpush(key, *serialized)
+        return await self.redis.lpush(key, *map(_encode, values))
     
     async def rpop(self, key: str) -> Optional[Any]:
         """Pop value from list tail"""
-        if not self.redis:
-            await self.connect()
-        
         value = await self.redis.rpop(key)
         
         if value is None:
             return None
         
-        try:
-            return json.loads(value)
-        except (json.JSONDecodeError, TypeError):
-            return value
+        return self._decode(value)
     
     async def lrange(self, key: str, start: int, stop: int) -> List[Any]:
         """Get list range"""
-        if not self.redis:
-            await self.connect()
-        
         values = await self.redis.lrange(key, start, stop)
         
-        # Deserialize values
-        results = []
-        for value in values:
-            try:
-                results.append(json.loads(value))
-            except (json.JSONDecodeError, TypeError):
-                results.append(value)
-        
-        return results
+        return [self._decode(value) for value in values]
     
     # Pub/Sub operations
     
     async def publish(self, channel: str, message: Any) -> int:
         """Publish message to channel"""
-        if not self.redis:
-            await self.connect()
+        return await self.redis.publish(channel, _encode(message))
+    
+    def publish_nowait(self, channel: str, message: Any) -> None:
+        """
+        Queue a message for publishing without waiting for Redis.
         
-        if isinstance(message, (dict, list)):
-            message = json.dumps(message)
+        Messages are sent in order by a background task, batched into one
+        pipeline per flush; use ``flush_publish`` when delivery must be
+        complete before continuing. Must be called from a running event loop.
+        """
+        self._pub_buffer.append((channel, _encode(message)))
+        self._pub_pending.set()
+        if self._pub_flusher is None or self._pub_flusher.done():
+            self._pub_flusher = asyncio.create_task(self._publish_flusher())
+    
+    async def flush_publish(self) -> None:
+        """
+        Send every message queued by ``publish_nowait``.
         
-        return await self.redis.publish(channel, message)
+        If the pipeline fails or the flush is cancelled, the batch is put
+        back at the front of the queue for the next flush (messages the
+        server already received may then be published twice).
+        """
+        async with self._pub_lock:
+            if not self._pub_buffer:
+                return
+            
+            batch, self._pub_buffer = self._pub_buffer, []
+            try:
+                pipe = self.redis.pipeline(transaction=False)
+                for channel, message in batch:
+                    pipe.publish(channel, message)
+                await pipe.execute()
+            except BaseException:
+                # Ahead of anything queued while the pipeline was in flight
+                self._pub_buffer[:0] = batch
+                raise
+    
+    async def _publish_flusher(self):
+        """Background task flushing queued messages as they arrive"""
+        while True:
+            await self._pub_pending.wait()
+            self._pub_pending.clear()
+            try:
+                await self.flush_publish()
+            except Exception as e:
+                logger.error(f"Failed to flush published messages: {e}")
     
     async def subscribe(self, channel: str, handler: Callable[[str, Any], None]):
         """Subscribe to channel with handler"""
-        if not self.redis:
-            await self.connect()
-        
         if channel not in self.pubsub_handlers:
             self.pubsub_handlers[channel] = []
+            queue = asyncio.Queue(maxsize=_DISPATCH_QUEUE_SIZE)
+            self._dispatch_queues[channel] = queue
+            self._dispatch_workers[channel] = asyncio.create_task(
+                self._dispatch_worker(channel, queue)
+            )
+            
+            shard = self._shard(channel)
+            pubsub = self._pubsubs[shard]
+            if pubsub is None:
+                pubsub = self._pubsubs[shard] = self.redis.pubsub()
+            await pubsub.subscribe(channel)
+            
+            # Start the shard's listener if not already running
+            task = self._listener_tasks[shard]
+            if task is None or task.done():
+                self._listener_tasks[shard] = asyncio.create_task(self._pubsub_listener(pubsub))
         
-        self.pubsub_handlers[channel].append(handler)
-        
-        # Start listener if not already running
-        if len(self.pubsub_handlers) == 1:
-            asyncio.create_task(self._pubsub_listener())
+        self.pubsub_handlers[channel].append((handler, asyncio.iscoroutinefunction(handler)))
     
     async def unsubscribe(self, channel: str, handler: Optional[Callable] = None):
         """Unsubscribe from channel"""
         if channel in self.pubsub_handlers:
             if handler:
-                self.pubsub_handlers[channel].remove(handler)
-            else:
+                handlers = self.pubsub_handlers[channel]
+                entry = next((entry for entry in handlers if entry[0] == handler), None)
+                if entry is None:
+                    return
+                handlers.remove(entry)
+            if not handler or not self.pubsub_handlers[channel]:
                 del self.pubsub_handlers[channel]
+                pubsub = self._pubsubs[self._shard(channel)]
+                if pubsub:
+                    await pubsub.unsubscribe(channel)
+                await self._stop_dispatch(channel)
     
-    async def _pubsub_listener(self):
-        """Background task to listen for pub/sub messages"""
-        channels = await self.redis.subscribe(*self.pubsub_handlers.keys())
-        
-        try:
-            while self.pubsub_handlers:
-                message = await channels[0].get()
-                
-                if message:
-                    channel = message.channel.decode() if isinstance(message.channel, bytes) else message.channel
-                    data = message.data
-                    
-                    # Deserialize message
-                    try:
-                        data = json.loads(data)
-                    except (json.JSONDecodeError, TypeError):
-                        pass
-                    
-                    # Call handlers
-                    for handler in self.pubsub_handlers.get(channel, []):
-                        try:
-                            await handler(channel, data) if asyncio.iscoroutinefunction(handler) else handler(channel, data)
-                        except Exception as e:
-                            logger.error(f"Error in pub/sub handler: {e}")
+    def _shard(self, channel: str) -> int:
+        """Index of the pub/sub connection a channel is subscribed on"""
+        return hash(channel) % _PUBSUB_SHARDS
+    
+    async def _pubsub_listener(self, pubsub: PubSub):
+        """
+        Background task to listen for pub/sub messages on one connection.
         
-        finally:
-            await self.redis.unsubscribe(*channels)
+        Messages are handed to the channel's bounded dispatch queue; when
+        handlers fall behind and the queue fills up, the reader waits, so
+        backlog stays in Redis' output buffer instead of process memory.
+        """
+        # listen() ends once every channel has been unsubscribed
+        async for message in pubsub.listen():
+            if message["type"] != "message":
+                continue
+            
+            channel = message["channel"].decode()
+            queue = self._dispatch_queues.get(channel)
+            if queue is not None:
+                await queue.put(self._decode(message["data"]))
+    
+    async def _dispatch_worker(self, channel: str, queue: asyncio.Queue):
+        """Run a channel's handlers for messages taken from its queue"""
+        while True:
+            data = await queue.get()
+            for handler, is_async in list(self.pubsub_handlers.get(channel, [])):
+                try:
+                    await handler(channel, data) if is_async else handler(channel, data)
+                except Exception as e:
+                    logger.error(f"Error in pub/sub handler: {e}")
+    
+    async def _stop_dispatch(self, channel: str):
+        """Cancel a channel's dispatch worker and drop its queue"""
+        self._dispatch_queues.pop(channel, None)
+        worker = self._dispatch_workers.pop(channel, None)
+        if worker is not None:
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
     
     # Distributed locking
     
@@ -374,10 +595,12 @@ class RedisCacheClient:
         timeout: float = 10.0,
         blocking: bool = True,
         blocking_timeout: float = None
-    ) -> Optional[Lock]:
+    ) -> Optional[RedisLock]:
         """
         Acquire distributed lock.
         
+        Each attempt is a single ``SET NX PX`` of a random owner token.
+        
         Args:
             key: Lock key
             timeout: Lock timeout in seconds
@@ -385,24 +608,31 @@ class RedisCacheClient:
             blocking_timeout: Maximum time to wait for lock
             
         Returns:
-            Lock object or None if not acquired
+            Lock handle or None if not acquired
         """
-        if not self.redis:
-            await self.connect()
+        lock = RedisLock(f"lock:{key}", os.urandom(16).hex())
+        ttl_ms = int(timeout * 1000)
+        deadline = None if blocking_timeout is None else time.monotonic() + blocking_timeout
         
-        lock = self.redis.lock(
-            f"lock:{key}",
-            timeout=timeout,
-            sleep=0.1
-        )
+        while True:
+            if await self.redis.set(lock.name, lock.token, nx=True, px=ttl_ms):
+                return lock
+            if not blocking or (deadline is not None and time.monotonic() >= deadline):
+                return None
+            await asyncio.sleep(0.1)
+    
+    async def release_lock(self, lock: RedisLock) -> bool:
+        """
+        Release distributed lock.
         
-        acquired = await lock.acquire(blocking=blocking, blocking_timeout=blocking_timeout)
+        A server-side script checks the owner token and deletes the key in
+        one round-trip, so a lock that expired and was taken by someone
+        else is left alone.
         
-        return lock if acquired else None
-    
-    async def release_lock(self, lock: Lock):
-        """Release distributed lock"""
-        await lock.release()
+        Returns:
+            True if the lock was still held and has been released
+        """
+        return bool(await self._release_lock_script(keys=[lock.name], args=[lock.token], client=self.redis))
     
     # Cache patterns
     
@@ -410,78 +640,122 @@ class RedisCacheClient:
         self,
         key: str,
         getter: Callable,
-        ttl: Optional[int] = None
+        ttl: Optional[int] = None,
+        lock_timeout: float = 10.0
     ) -> Any:
         """
         Get from cache or compute and set.
         
+        A hit costs one round-trip. On a miss the same script takes a
+        short-lived compute lock, so when many callers miss at once only
+        one runs ``getter``; the others poll until the value appears (or
+        the lock expires and one of them takes over).
+        
         Args:
             key: Cache key
             getter: Function to compute value if not cached
             ttl: Time to live
+            lock_timeout: Seconds the compute lock is held at most
             
         Returns:
             Cached or computed value
         """
-        # Try to get from cache
-        value = await self.get(key)
+        lock = RedisLock(f"{key}:compute-lock", os.urandom(16).hex())
+        lock_ms = int(lock_timeout * 1000)
         
-        if value is not None:
-            return value
-        
-        # Compute value
-        if asyncio.iscoroutinefunction(getter):
-            value = await getter()
-        else:
-            value = getter()
+        while True:
+            status, value = await self._get_or_lock_script(
+                keys=[key, lock.name], args=[lock.token, lock_ms], client=self.redis
+            )
+            if status == _CACHE_HIT:
+                return self._decode(value)
+            if status == _CACHE_LOCKED:
+                break
+            await asyncio.sleep(0.05)
         
-        # Cache value
-        await self.set(key, value, ttl=ttl)
+        try:
+            # Compute value
+            if asyncio.iscoroutinefunction(getter):
+                value = await getter()
+            else:
+                value = getter()
+            
+            # Cache value
+            await self.set(key, value, ttl=ttl)
+        finally:
+            await self.release_lock(lock)
         
         return value
     
     async def cache_invalidate_pattern(self, pattern: str) -> int:
-        """Invalidate cache keys matching pattern"""
-        if not self.redis:
-            await self.connect()
+        """
+        Invalidate cache keys matching pattern.
         
-        # Get matching keys
-        keys = []
+        Keys are collected with SCAN and removed with UNLINK in batches, so
+        neither the client nor Redis ever handles the whole key set at once
+        and memory is reclaimed in Redis' background thread.
+        """
+        deleted = 0
+        pending: List[Any] = []
         cursor = 0
         
         while True:
-            cursor, batch = await self.redis.scan(cursor, match=pattern)
-            keys.extend(batch)
+            cursor, batch = await self.redis.scan(cursor, match=pattern, count=_SCAN_COUNT)
+            pending.extend(batch)
             
-            if cursor == 0:
-                break
-        
-        # Delete keys
-        if keys:
-            return await self.delete(*keys)
-        
-        return 0
+            done = cursor == 0
+            if pending and (done or len(pending) >= _UNLINK_BATCH):
+                deleted += await self._unlink(pending)
+                pending = []
+            
+            if done:
+                return deleted
+    
+    async def _unlink(self, keys: List[Any]) -> int:
+        """UNLINK keys in chunks sent as one pipeline"""
+        pipe = self.redis.pipeline()
+        for i in range(0, len(keys), _UNLINK_BATCH):
+            pipe.unlink(*keys[i:i + _UNLINK_BATCH])
+        return sum(await pipe.execute())
     
     # Utility methods
     
-    def _get_exist_flag(self, nx: bool, xx: bool) -> Optional[str]:
-        """Get exist flag for SET command"""
-        if nx and xx:
-            raise ValueError("Cannot specify both nx and xx")
+    def _decode(self, value: Any) -> Any:
+        """Deserialize a cache value.
         
-        if nx:
-            return "SET_IF_NOT_EXIST"
-        elif xx:
-            return "SET_IF_EXIST"
-        
-        return None
+        MessagePack values are recognised by their prefix; anything else is
+        tried as JSON (values written before the codec switch, numbers) and
+        otherwise returned as text, or as bytes if it is not text. Raw
+        values that merely start with the prefix byte are returned as-is.
+        """
+        if not isinstance(value, bytes) or not value:
+            return self._text(value)
+        first = value[0]
+        if first == _MSGPACK_MAGIC[0]:
+            try:
+                return msgpack.unpackb(value[1:], raw=False, strict_map_key=False)
+            except (ValueError, msgpack.UnpackException):
+                return self._text(value)
+        if first in _JSON_FIRST_BYTES:
+            try:
+                return orjson.loads(value)
+            except orjson.JSONDecodeError:
+                pass
+        return self._text(value)
+    
+    def _text(self, value: Any) -> Any:
+        """Decode raw bytes as text when decode_responses is enabled."""
+        if self.decode_responses and isinstance(value, bytes):
+            try:
+                return value.decode(self.encoding)
+            except UnicodeDecodeError:
+                return value
+        return value
     
     async def health_check(self) -> Dict[str, Any]:
         """Perform Redis health check"""
         try:
-            if not self.redis:
-                await self.connect()
-            
+            await self.connect()
             # Ping Redis
             await self.redis.ping()
             
@@ -493,7 +767,7 @@ class RedisCacheClient:
                 "version": info.get("redis_version", "unknown"),
                 "connected_clients": info.get("connected_clients", 0),
                 "used_memory_human": info.get("used_memory_human", "unknown"),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_now_iso()
             }
             
         except Exception as e:
@@ -501,7 +775,7 @@ class RedisCacheClient:
             return {
                 "status": "unhealthy",
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_now_iso()
             }
     
     async def __aenter__(self):
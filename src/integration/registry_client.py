@@ -5,14 +5,59 @@ with the DEAN orchestration service registry.
 """
 
 import asyncio
+import hashlib
+import importlib.util
+import random
 import socket
+import time
+from functools import lru_cache
 import httpx
 import logging
-from typing import Optional, Dict, List, Any
+import orjson
+from typing import Optional, Dict, List, Any, Tuple
 from datetime import datetime
 
+# httpx speaks HTTP/2 when the optional h2 package is installed; without
+# it registry calls stay on HTTP/1.1 keep-alive
+_HAS_H2 = importlib.util.find_spec("h2") is not None
+
 logger = logging.getLogger(__name__)
 
+# Registry calls are small; fail fast on connect so heartbeats stay on time
+_REGISTRY_TIMEOUT = httpx.Timeout(connect=2.0, read=5.0, write=5.0, pool=5.0)
+_REGISTRY_LIMITS = httpx.Limits(
+    max_connections=32,
+    max_keepalive_connections=16,
+    keepalive_expiry=60.0
+)
+
+
+@lru_cache(maxsize=1)
+def _local_address() -> str:
+    """Address other containers can reach this host at.
+    
+    In Docker the hostname is usually the container ID, so resolve it to
+    an IPv4 address in-process; fall back to the hostname, then localhost.
+    """
+    try:
+        hostname = socket.gethostname()
+    except OSError:
+        return "localhost"
+    
+    try:
+        addrs = socket.getaddrinfo(hostname, None, family=socket.AF_INET)
+    except OSError:
+        return hostname
+    return addrs[0][4][0] if addrs else hostname
+
+
+def _metadata_hash(metadata: Optional[Dict[str, Any]]) -> str:
+    """Stable digest of service metadata, compared by the registry on heartbeat."""
+    return hashlib.blake2b(
+        orjson.dumps(metadata or {}, option=orjson.OPT_SORT_KEYS),
+        digest_size=16
+    ).hexdigest()
+
 
 class ServiceRegistryClient:
     """Client for services to interact with the DEAN service registry."""
@@ -44,34 +89,25 @@ class ServiceRegistryClient:
         self.service_version = service_version
         self.service_host = service_host or self._get_hostname()
         self.api_key = api_key
+        self._auth_headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
         self.heartbeat_interval = heartbeat_interval
         
         self._http_client: Optional[httpx.AsyncClient] = None
         self._heartbeat_task: Optional[asyncio.Task] = None
         self._running = False
         
+        # Registration state, kept for re-registering and metadata pushes
+        self._metadata: Optional[Dict[str, Any]] = None
+        self._health_endpoint: Optional[Dict[str, Any]] = None
+        self._metadata_hash = _metadata_hash(None)
+        
+        # Resolved service URLs: name -> (url, expiry on the monotonic clock)
+        self._url_cache: Dict[str, Tuple[str, float]] = {}
+        self._url_ttl = 30.0
+        
     def _get_hostname(self) -> str:
         """Get hostname of current machine."""
-        try:
-            # Try to get the hostname that's accessible from other containers
-            hostname = socket.gethostname()
-            # In Docker, this might be the container ID, so try to get IP
-            try:
-                # Get IP address
-                import subprocess
-                result = subprocess.run(
-                    ['hostname', '-i'],
-                    capture_output=True,
-                    text=True,
-                    timeout=2
-                )
-                if result.returncode == 0:
-                    return result.stdout.strip().split()[0]
-            except:
-                pass
-            return hostname
-        except:
-            return "localhost"
+        return _local_address()
             
     async def start(
         self,
@@ -90,27 +126,45 @@ class ServiceRegistryClient:
         if self._running:
             return True
             
-        self._http_client = httpx.AsyncClient(timeout=10.0)
+        self._http_client = httpx.AsyncClient(
+            http2=_HAS_H2,
+            timeout=_REGISTRY_TIMEOUT,
+            limits=_REGISTRY_LIMITS
+        )
+        self._metadata = metadata
+        self._health_endpoint = health_endpoint
+        self._metadata_hash = _metadata_hash(metadata)
         
-        # Prepare headers
-        headers = {}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-            
+        if not await self._register():
+            return False
+        
+        self._running = True
+        # Start heartbeat task
+        self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        logger.info(f"Successfully registered service '{self.service_name}' with DEAN")
+        return True
+    
+    async def _register(self) -> bool:
+        """Send the registration request.
+        
+        Returns:
+            True if registration successful
+        """
         # Register with the registry
         try:
             registration_data = {
                 "name": self.service_name,
                 "host": self.service_host,
                 "port": self.service_port,
-                "version": self.service_version
+                "version": self.service_version,
+                "metadata_hash": self._metadata_hash
             }
             
-            if metadata:
-                registration_data["metadata"] = metadata
+            if self._metadata:
+                registration_data["metadata"] = self._metadata
                 
-            if health_endpoint:
-                registration_data["health_endpoint"] = health_endpoint
+            if self._health_endpoint:
+                registration_data["health_endpoint"] = self._health_endpoint
             else:
                 # Default health endpoint
                 registration_data["health_endpoint"] = {
@@ -123,20 +177,16 @@ class ServiceRegistryClient:
             response = await self._http_client.post(
                 f"{self.registry_url}/api/v1/registry/register",
                 json=registration_data,
-                headers=headers
+                headers=self._auth_headers
             )
             
             if response.status_code == 200:
-                self._running = True
-                # Start heartbeat task
-                self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
-                logger.info(f"Successfully registered service '{self.service_name}' with DEAN")
                 return True
-            else:
-                logger.error(
-                    f"Failed to register service: {response.status_code} - {response.text}"
-                )
-                return False
+            
+            logger.error(
+                f"Failed to register service: {response.status_code} - {response.text}"
+            )
+            return False
                 
         except Exception as e:
             logger.error(f"Failed to register with DEAN: {e}")
@@ -159,13 +209,9 @@ class ServiceRegistryClient:
                 
         # Deregister from DEAN
         try:
-            headers = {}
-            if self.api_key:
-                headers["Authorization"] = f"Bearer {self.api_key}"
-                
             response = await self._http_client.delete(
                 f"{self.registry_url}/api/v1/registry/services/{self.service_name}",
-                headers=headers
+                headers=self._auth_headers
             )
             
             if response.status_code == 200:
@@ -194,16 +240,16 @@ class ServiceRegistryClient:
         if not self._running:
             logger.warning("Registry client not running")
             return False
+        
+        self._metadata = metadata
+        self._metadata_hash = _metadata_hash(metadata)
             
         try:
-            headers = {}
-            if self.api_key:
-                headers["Authorization"] = f"Bearer {self.api_key}"
-                
             response = await self._http_client.patch(
                 f"{self.registry_url}/api/v1/registry/services/{self.service_name}/metadata",
                 json=metadata,
-                headers=headers
+                params={"metadata_hash": self._metadata_hash},
+                headers=self._auth_headers
             )
             
             return response.status_code == 200
@@ -222,13 +268,9 @@ class ServiceRegistryClient:
             Service info if found
         """
         try:
-            headers = {}
-            if self.api_key:
-                headers["Authorization"] = f"Bearer {self.api_key}"
-                
             response = await self._http_client.get(
                 f"{self.registry_url}/api/v1/registry/services/{service_name}",
-                headers=headers
+                headers=self._auth_headers
             )
             
             if response.status_code == 200:
@@ -249,14 +291,10 @@ class ServiceRegistryClient:
             List of matching services
         """
         try:
-            headers = {}
-            if self.api_key:
-                headers["Authorization"] = f"Bearer {self.api_key}"
-                
             response = await self._http_client.get(
                 f"{self.registry_url}/api/v1/registry/services",
                 params={"type": service_type},
-                headers=headers
+                headers=self._auth_headers
             )
             
             if response.status_code == 200:
@@ -270,18 +308,30 @@ class ServiceRegistryClient:
     async def get_service_url(self, service_name: str) -> Optional[str]:
         """Get the base URL for a service.
         
+        Resolved URLs are cached for about ``_url_ttl`` seconds; the expiry
+        is jittered by +/-20% so entries do not all refresh at once.
+        
         Args:
             service_name: Name of service
             
         Returns:
             Service base URL if found
         """
+        now = time.monotonic()
+        cached = self._url_cache.get(service_name)
+        if cached and now < cached[1]:
+            return cached[0]
+        
         service_info = await self.discover_service(service_name)
         if service_info:
             host = service_info.get("host")
             port = service_info.get("port")
             protocol = service_info.get("health_endpoint", {}).get("protocol", "http")
-            return f"{protocol}://{host}:{port}"
+            url = f"{protocol}://{host}:{port}"
+            self._url_cache[service_name] = (url, now + random.uniform(0.8, 1.2) * self._url_ttl)
+            return url
+        
+        self._url_cache.pop(service_name, None)
         return None
         
     async def call_service(
@@ -311,7 +361,16 @@ class ServiceRegistryClient:
                 
             # Make request
             url = f"{base_url}{endpoint}"
-            response = await self._http_client.request(method, url, **kwargs)
+            try:
+                response = await self._http_client.request(method, url, **kwargs)
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                # The service may have moved; resolve it again next time
+                self._url_cache.pop(service_name, None)
+                raise
+            if response.status_code == 503:
+                # Instance draining or gone; a 404 is the endpoint's answer
+                # and says nothing about where the service lives
+                self._url_cache.pop(service_name, None)
             return response
             
         except Exception as e:
@@ -319,27 +378,36 @@ class ServiceRegistryClient:
             return None
             
     async def _heartbeat_loop(self) -> None:
-        """Send periodic heartbeats to maintain registration."""
+        """Send periodic heartbeats to maintain registration.
+        
+        Each heartbeat carries the hash of the current metadata. The
+        registry answers 409 when its copy is stale, and the metadata is
+        pushed again; 404 means the registration was lost and triggers a
+        re-registration. Other failures are only logged.
+        """
         while self._running:
             try:
                 await asyncio.sleep(self.heartbeat_interval)
                 
                 # Send heartbeat
-                headers = {}
-                if self.api_key:
-                    headers["Authorization"] = f"Bearer {self.api_key}"
-                    
-                response = await self._http_client.post(
-                    f"{self.registry_url}/api/v1/registry/services/{self.service_name}/heartbeat",
-                    headers=headers
+                response = await asyncio.wait_for(
+                    self._http_client.post(
+                        f"{self.registry_url}/api/v1/registry/services/{self.service_name}/heartbeat",
+                        json={"metadata_hash": self._metadata_hash, "ts": time.time()},
+                        headers=self._auth_headers
+                    ),
+                    timeout=5.0
                 )
                 
-                if response.status_code != 200:
+                if response.status_code == 409:
+                    await self.update_metadata(self._metadata or {})
+                elif response.status_code == 404:
+                    logger.warning("Registration lost, re-registering")
+                    await self._register()
+                elif response.status_code != 200:
                     logger.warning(
                         f"Heartbeat failed: {response.status_code} - {response.text}"
                     )
-                    # Re-register if heartbeat fails
-                    await self.start()
                     
             except asyncio.CancelledError:
                 break
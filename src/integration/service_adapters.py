@@ -1,14 +1,31 @@
 """Service-specific adapter patterns for protocol handling."""
 
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Protocol, Tuple
 from datetime import datetime
 import asyncio
+import time
 from contextlib import asynccontextmanager
 
-from .base import ServiceClient, ServiceError
+from .base import LazySession, ServiceClient, ServiceError
 from .indexagent_client import IndexAgentClient
 from .airflow_client import AirflowClient
 from .infra_client import EvolutionAPIClient
+from .timestamps import utc_now_iso
+
+
+async def _gather_limited(aws: Iterable[Awaitable[Any]], limit: int) -> List[Any]:
+    """Await concurrently with at most ``limit`` in flight.
+    
+    Exceptions are returned in place of results, as with
+    ``asyncio.gather(..., return_exceptions=True)``.
+    """
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def run(aw: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await aw
+    
+    return await asyncio.gather(*(run(aw) for aw in aws), return_exceptions=True)
 
 
 class EvolutionWorkflowAdapter:
@@ -47,7 +64,7 @@ class EvolutionWorkflowAdapter:
         
         Coordinates:
         1. Population initialization in IndexAgent
-        2. Evolution start in Evolution API
+        2. Evolution start in Evolution API (concurrently with 1)
         3. Workflow execution in Airflow
         4. Result aggregation
         
@@ -70,16 +87,8 @@ class EvolutionWorkflowAdapter:
         }
         
         try:
-            # Step 1: Initialize population in IndexAgent
-            population = await self.indexagent.initialize_population(
-                size=population_size,
-                agent_type=agent_type,
-                config=kwargs.get("agent_config", {}),
-            )
-            trial_result["population_id"] = population.get("population_id")
-            trial_result["status"] = "population_created"
-            
-            # Step 2: Start evolution in Evolution API
+            # Steps 1 and 2 are independent: initialize the population in
+            # IndexAgent while the Evolution API starts the trial
             evolution_config = {
                 "population_size": population_size,
                 "generations": generations,
@@ -87,7 +96,24 @@ class EvolutionWorkflowAdapter:
                 "crossover_rate": kwargs.get("crossover_rate", 0.7),
                 "selection_method": kwargs.get("selection_method", "tournament"),
             }
-            evolution = await self.evolution.start_evolution(**evolution_config)
+            pop_task = asyncio.create_task(
+                self.indexagent.initialize_population(
+                    size=population_size,
+                    agent_type=agent_type,
+                    config=kwargs.get("agent_config", {}),
+                )
+            )
+            evo_task = asyncio.create_task(
+                self.evolution.start_evolution(**evolution_config)
+            )
+            try:
+                population, evolution = await asyncio.gather(pop_task, evo_task)
+            except BaseException:
+                pop_task.cancel()
+                evo_task.cancel()
+                raise
+            
+            trial_result["population_id"] = population.get("population_id")
             trial_result["trial_id"] = evolution.get("trial_id")
             trial_result["status"] = "evolution_started"
             
@@ -139,15 +165,18 @@ class PatternPropagationAdapter:
         self,
         indexagent: IndexAgentClient,
         evolution: EvolutionAPIClient,
+        max_concurrency: int = 16,
     ):
         """Initialize pattern adapter.
         
         Args:
             indexagent: IndexAgent client
             evolution: Evolution API client
+            max_concurrency: Maximum IndexAgent requests in flight
         """
         self.indexagent = indexagent
         self.evolution = evolution
+        self.max_concurrency = max_concurrency
     
     async def propagate_successful_patterns(
         self,
@@ -177,27 +206,46 @@ class PatternPropagationAdapter:
                 "trial_id": trial_id,
             }
         
-        # Get pattern details from IndexAgent
-        detailed_patterns = []
-        for pattern in patterns:
-            pattern_detail = await self.indexagent.get_patterns(
-                pattern_type=pattern.get("type"),
-            )
-            detailed_patterns.extend(pattern_detail)
+        # Get pattern details from IndexAgent once per distinct type;
+        # failed lookups are skipped
+        pattern_types = list(dict.fromkeys(pattern.get("type") for pattern in patterns))
+        detail_lists = await _gather_limited(
+            (
+                self.indexagent.get_patterns(pattern_type=pattern_type)
+                for pattern_type in pattern_types
+            ),
+            self.max_concurrency,
+        )
+        detailed_patterns = [
+            detail
+            for details in detail_lists
+            if not isinstance(details, Exception)
+            for detail in details
+        ]
         
         # Apply patterns to target agents
         if target_agents is None:
-            # Get all active agents
-            agents = await self.indexagent.list_agents()
-            target_agents = [agent["id"] for agent in agents]
+            # Get all active agents, fetching only their IDs
+            target_agents = [
+                agent["id"]
+                async for agent in self.indexagent.aiter_agents(fields=["id"])
+            ]
         
-        results = []
-        for pattern in detailed_patterns:
-            result = await self.indexagent.apply_pattern(
-                pattern_id=pattern["id"],
-                target_agents=target_agents,
-            )
-            results.append(result)
+        applied = await _gather_limited(
+            (
+                self.indexagent.apply_pattern(
+                    pattern_id=pattern["id"],
+                    target_agents=target_agents,
+                )
+                for pattern in detailed_patterns
+            ),
+            self.max_concurrency,
+        )
+        results = [
+            {"pattern_id": pattern["id"], "status": "failed", "error": str(result)}
+            if isinstance(result, Exception) else result
+            for pattern, result in zip(detailed_patterns, applied)
+        ]
         
         return {
             "status": "patterns_propagated",
@@ -210,25 +258,56 @@ class PatternPropagationAdapter:
 class HealthCheckAdapter:
     """Adapter for aggregated health checking across services."""
     
-    def __init__(self, clients: Dict[str, ServiceClient]):
+    def __init__(
+        self,
+        clients: Dict[str, ServiceClient],
+        probe_timeout: float = 3.0,
+        cache_ttl: float = 2.0,
+    ):
         """Initialize health check adapter.
         
         Args:
             clients: Dictionary of service name to client
+            probe_timeout: Seconds to wait for each service's health check
+            cache_ttl: Seconds an aggregate result is reused
         """
         self.clients = clients
+        self._probe_timeout = probe_timeout
+        self._ttl = cache_ttl
+        # (monotonic time, result) of the last aggregate check
+        self._cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._lock = asyncio.Lock()
     
     async def check_all_services(self) -> Dict[str, Any]:
         """Check health of all services concurrently.
         
+        Results are reused for ``cache_ttl`` seconds, and concurrent callers
+        wait for a single in-flight check instead of starting their own.
+        
         Returns:
             Aggregated health status
         """
+        cached = self._cache
+        if cached and time.monotonic() - cached[0] < self._ttl:
+            return cached[1]
+        
+        async with self._lock:
+            cached = self._cache
+            if cached and time.monotonic() - cached[0] < self._ttl:
+                return cached[1]
+            
+            result = await self._check_all_services()
+            self._cache = (time.monotonic(), result)
+            return result
+    
+    async def _check_all_services(self) -> Dict[str, Any]:
+        """Run every service's health check and aggregate the results."""
         health_checks = {}
         
-        # Run health checks concurrently
+        # Run health checks concurrently; a hung service only costs
+        # probe_timeout
         tasks = {
-            name: client.health_check()
+            name: asyncio.wait_for(client.health_check(), timeout=self._probe_timeout)
             for name, client in self.clients.items()
         }
         
@@ -240,7 +319,13 @@ class HealthCheckAdapter:
         # Process results
         overall_status = "healthy"
         for (name, _), result in zip(tasks.items(), results):
-            if isinstance(result, Exception):
+            if isinstance(result, asyncio.TimeoutError):
+                health_checks[name] = {
+                    "status": "unhealthy",
+                    "error": "timeout",
+                }
+                overall_status = "unhealthy"
+            elif isinstance(result, Exception):
                 health_checks[name] = {
                     "status": "unhealthy",
                     "error": str(result),
@@ -253,19 +338,26 @@ class HealthCheckAdapter:
         
         return {
             "status": overall_status,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": utc_now_iso(),
             "services": health_checks,
         }
 
 
 class ServicePool:
-    """Connection pool for managing multiple service clients."""
+    """Connection pool for managing multiple service clients.
+    
+    All clients share one HTTP session, so connections to services behind
+    the same host are reused across clients and the total socket count is
+    bounded by a single pool.
+    """
     
     def __init__(
         self,
         indexagent_url: str = "http://localhost:8081",
         airflow_url: str = "http://localhost:8080",
         evolution_url: str = "http://localhost:8090",
+        session: Optional[LazySession] = None,
+        warm: bool = True,
         **kwargs
     ):
         """Initialize service pool.
@@ -274,11 +366,22 @@ class ServicePool:
             indexagent_url: IndexAgent API URL
             airflow_url: Airflow API URL
             evolution_url: Evolution API URL
+            session: Shared session for the clients; created from the
+                ``timeout``/``pool_size`` kwargs if omitted. A session
+                passed in is left open by ``close()``.
+            warm: Open a connection to each service on context entry
             **kwargs: Additional client configuration
         """
-        self.indexagent = IndexAgentClient(indexagent_url, **kwargs)
-        self.airflow = AirflowClient(airflow_url, **kwargs)
-        self.evolution = EvolutionAPIClient(evolution_url, **kwargs)
+        self.warm = warm
+        self._owns_session = session is None
+        self._session = session or LazySession(
+            timeout=kwargs.get("timeout", 30),
+            pool_size=kwargs.get("pool_size"),
+        )
+        
+        self.indexagent = IndexAgentClient(indexagent_url, session=self._session, **kwargs)
+        self.airflow = AirflowClient(airflow_url, session=self._session, **kwargs)
+        self.evolution = EvolutionAPIClient(evolution_url, session=self._session, **kwargs)
         
         self.clients = {
             "indexagent": self.indexagent,
@@ -302,9 +405,21 @@ class ServicePool:
         """Close all client connections."""
         for client in self.clients.values():
             await client.close()
+        if self._owns_session:
+            await self._session.close()
+    
+    async def _warm(self):
+        """Open a keep-alive connection to each service.
+        
+        Runs the aggregate health check and ignores its result, so the
+        first real request does not pay for connection setup.
+        """
+        await self.health.check_all_services()
     
     async def __aenter__(self):
         """Async context manager entry."""
+        if self.warm:
+            await self._warm()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -320,8 +435,5 @@ async def create_service_pool(**kwargs) -> ServicePool:
         async with create_service_pool() as pool:
             result = await pool.workflow.execute_evolution_trial(...)
     """
-    pool = ServicePool(**kwargs)
-    try:
-        yield pool
-    finally:
-        await pool.close()
\ No newline at end of file
+    async with ServicePool(**kwargs) as pool:
+        yield pool
\ No newline at end of file
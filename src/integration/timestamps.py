@@ -0,0 +1,8 @@
+"""Timestamp helpers shared by the integration clients."""
+
+from datetime import datetime, timezone
+
+
+def utc_now_iso() -> str:
+    """Current UTC time as ISO-8601 with millisecond precision."""
+    return datetime.now(timezone.utc).isoformat(timespec='milliseconds')
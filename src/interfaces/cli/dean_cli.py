@@ -3,13 +3,15 @@
 import click
 import asyncio
 from .interactive import run_interactive_cli
+from ...integration import enable_uvloop
 
 
 @click.group()
 @click.version_option(version='0.1.0', prog_name='dean')
 def cli():
     """DEAN Orchestration CLI - Coordinate the Distributed Evolutionary Agent Network."""
-    pass
+    # Subcommands drive service clients through asyncio.run
+    enable_uvloop()
 
 
 @cli.command()
@@ -137,6 +139,20 @@ def list():
     asyncio.run(list_trials())
 
 
+def _yaml():
+    """Import PyYAML on demand, preferring its libyaml-backed C loader/dumper.
+    
+    Returns:
+        (yaml module, SafeLoader, SafeDumper)
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    except ImportError:
+        from yaml import SafeLoader, SafeDumper
+    return yaml, SafeLoader, SafeDumper
+
+
 @cli.group()
 def config():
     """Manage DEAN configuration."""
@@ -146,8 +162,8 @@ def config():
 @config.command()
 def show():
     """Show current configuration."""
-    import yaml
     from pathlib import Path
+    yaml, SafeLoader, SafeDumper = _yaml()
     
     config_file = Path.home() / ".dean" / "config.yaml"
     
@@ -157,11 +173,11 @@ def show():
         return
     
     with open(config_file) as f:
-        config_data = yaml.safe_load(f)
+        config_data = yaml.load(f, Loader=SafeLoader)
     
     click.echo("\nCurrent Configuration")
     click.echo("=" * 40)
-    click.echo(yaml.dump(config_data, default_flow_style=False))
+    click.echo(yaml.dump(config_data, Dumper=SafeDumper, default_flow_style=False))
 
 
 @config.command()
@@ -170,8 +186,8 @@ def show():
 @click.option('--evolution-url', help='Evolution API URL')
 def set(indexagent_url, airflow_url, evolution_url):
     """Update configuration values."""
-    import yaml
     from pathlib import Path
+    yaml, SafeLoader, SafeDumper = _yaml()
     
     config_file = Path.home() / ".dean" / "config.yaml"
     config_file.parent.mkdir(exist_ok=True)
@@ -179,7 +195,7 @@ def set(indexagent_url, airflow_url, evolution_url):
     # Load existing config or create new
     if config_file.exists():
         with open(config_file) as f:
-            config_data = yaml.safe_load(f) or {}
+            config_data = yaml.load(f, Loader=SafeLoader) or {}
     else:
         config_data = {}
     
@@ -201,7 +217,7 @@ def set(indexagent_url, airflow_url, evolution_url):
     
     # Save config
     with open(config_file, 'w') as f:
-        yaml.dump(config_data, f, default_flow_style=False)
+        yaml.dump(config_data, f, Dumper=SafeDumper, default_flow_style=False)
     
     click.echo(f"\nConfiguration saved to: {config_file}")
 
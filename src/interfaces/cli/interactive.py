@@ -14,7 +14,7 @@ from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from ...integration import ServicePool, create_service_pool
+from ...integration import ServicePool, create_service_pool, enable_uvloop
 from ...orchestration import EvolutionTrialCoordinator, SystemDeployer
 
 # Configure structured logging
@@ -325,5 +325,6 @@ class InteractiveCLI:
 
 def run_interactive_cli():
     """Run the interactive CLI."""
+    enable_uvloop()
     cli = InteractiveCLI()
     asyncio.run(cli.start())
\ No newline at end of file
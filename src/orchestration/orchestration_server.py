@@ -46,6 +46,13 @@ class ServiceRegistrationRequest(BaseModel):
     version: str
     metadata: Optional[Dict[str, Any]] = None
     health_endpoint: Optional[Dict[str, Any]] = None
+    metadata_hash: Optional[str] = None
+
+
+class HeartbeatRequest(BaseModel):
+    """Service heartbeat carrying the hash of the metadata the service holds."""
+    metadata_hash: Optional[str] = None
+    ts: Optional[float] = None
 
 
 class ServiceStatusResponse(BaseModel):
@@ -273,6 +280,7 @@ async def register_service(request: ServiceRegistrationRequest):
             metadata=metadata,
             health_endpoint=health_endpoint
         )
+        service.metadata_hash = request.metadata_hash
         
         return ServiceStatusResponse(
             name=service.name,
@@ -343,8 +351,12 @@ async def get_service(service_name: str):
 
 
 @app.post("/api/v1/registry/services/{service_name}/heartbeat")
-async def service_heartbeat(service_name: str):
-    """Receive heartbeat from a service."""
+async def service_heartbeat(service_name: str, heartbeat: Optional[HeartbeatRequest] = None):
+    """Receive heartbeat from a service.
+    
+    Responds 409 when the service's metadata hash differs from the one
+    stored here, asking it to push its metadata again.
+    """
     service = await service_registry.discover_service(service_name)
     if not service:
         raise HTTPException(status_code=404, detail=f"Service '{service_name}' not found")
@@ -353,17 +365,26 @@ async def service_heartbeat(service_name: str):
     service.last_health_check = datetime.utcnow()
     service.status = ServiceStatus.HEALTHY
     
+    if (heartbeat and heartbeat.metadata_hash and service.metadata_hash
+            and heartbeat.metadata_hash != service.metadata_hash):
+        raise HTTPException(status_code=409, detail="Metadata out of date")
+    
     return {"message": "Heartbeat received"}
 
 
 @app.patch("/api/v1/registry/services/{service_name}/metadata")
-async def update_service_metadata(service_name: str, metadata: Dict[str, Any]):
+async def update_service_metadata(
+    service_name: str,
+    metadata: Dict[str, Any],
+    metadata_hash: Optional[str] = None
+):
     """Update service metadata."""
     service = await service_registry.discover_service(service_name)
     if not service:
         raise HTTPException(status_code=404, detail=f"Service '{service_name}' not found")
         
     service.metadata = ServiceMetadata(**metadata)
+    service.metadata_hash = metadata_hash
     return {"message": f"Metadata updated for service '{service_name}'"}
 
 
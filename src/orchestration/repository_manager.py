@@ -15,7 +15,7 @@ from typing import Dict, Any, List, Optional
 import logging
 from dataclasses import dataclass, asdict
 import asyncpg
-import aioredis
+from redis import asyncio as aioredis
 
 logger = logging.getLogger(__name__)
 
@@ -84,6 +84,7 @@ class ServiceInfo:
     last_health_check: Optional[datetime] = None
     last_error: Optional[str] = None
     registration_time: datetime = field(default_factory=datetime.utcnow)
+    metadata_hash: Optional[str] = None
     
     @property
     def base_url(self) -> str:
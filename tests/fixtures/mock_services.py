@@ -78,6 +78,12 @@ class MockIndexAgentService:
         offset = int(request.query.get('offset', 0))
         
         agents_list = list(self.agents.values())[offset:offset + limit]
+        if 'fields' in request.query:
+            fields = request.query['fields'].split(',')
+            agents_list = [
+                {field: agent[field] for field in fields if field in agent}
+                for agent in agents_list
+            ]
         return web.json_response(agents_list)
     
     async def create_agent(self, request: web.Request) -> web.Response:
@@ -383,9 +389,12 @@ class MockEvolutionAPIService:
         app.router.add_get('/health', self.health_check)
         app.router.add_post('/evolution/start', self.start_evolution)
         app.router.add_get('/evolution/status', self.get_evolution_status)
+        app.router.add_get('/evolution/status:stream', self.stream_evolution_status)
         app.router.add_post('/evolution/stop', self.stop_evolution)
         app.router.add_get('/patterns', self.get_patterns)
         app.router.add_post('/patterns/apply', self.apply_patterns)
+        app.router.add_post('/patterns/apply:batch', self.apply_patterns_batch)
+        app.router.add_post('/patterns/evaluate:batch', self.evaluate_patterns_batch)
         app.router.add_get('/metrics', self.get_metrics)
         return app
     
@@ -461,6 +470,33 @@ class MockEvolutionAPIService:
             "diversity": 0.72
         })
     
+    async def stream_evolution_status(self, request: web.Request) -> web.StreamResponse:
+        """Stream evolution status as server-sent events until the trial ends."""
+        trial_id = request.query.get('trial_id', self.current_trial)
+        
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        
+        last_status = None
+        while trial_id in self.trials:
+            trial = self.trials[trial_id]
+            status = {
+                "trial_id": trial_id,
+                "status": trial["status"],
+                "current_generation": trial["current_generation"],
+                "total_generations": trial["total_generations"]
+            }
+            if status != last_status:
+                await response.write(f"data: {json.dumps(status)}\n\n".encode())
+                last_status = status
+            
+            if trial["status"] != "running":
+                break
+            await asyncio.sleep(0.05)
+        
+        await response.write_eof()
+        return response
+    
     async def stop_evolution(self, request: web.Request) -> web.Response:
         """Stop evolution endpoint."""
         data = await request.json()
@@ -486,6 +522,36 @@ class MockEvolutionAPIService:
             "target_population": data.get("target_population")
         })
     
+    async def apply_patterns_batch(self, request: web.Request) -> web.Response:
+        """Batched apply patterns endpoint."""
+        data = await request.json()
+        
+        return web.json_response({
+            "results": [
+                {
+                    "status": "applied",
+                    "patterns_applied": len(item.get("pattern_ids", [])),
+                    "target_population": item.get("target_population")
+                }
+                for item in data.get("items", [])
+            ]
+        })
+    
+    async def evaluate_patterns_batch(self, request: web.Request) -> web.Response:
+        """Batched pattern evaluation endpoint."""
+        data = await request.json()
+        
+        return web.json_response({
+            "results": [
+                {
+                    "pattern_id": item.get("pattern_id"),
+                    "effectiveness": 0.8,
+                    "agents_tested": len(item.get("test_agents", []))
+                }
+                for item in data.get("items", [])
+            ]
+        })
+    
     async def get_metrics(self, request: web.Request) -> web.Response:
         """Get metrics endpoint."""
         # Return Prometheus-style metrics
@@ -0,0 +1,205 @@
+"""Unit tests for the database client."""
+
+import re
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from integration.database_client import DatabaseClient, _quote_ident
+
+
+@pytest.fixture
+def client():
+    """Create a database client that is never connected."""
+    return DatabaseClient("postgresql://test@localhost/test")
+
+
+@pytest.fixture
+def connection(client):
+    """Give the client a mocked pool handing out one mocked connection."""
+    conn = MagicMock()
+    conn.execute = AsyncMock(return_value="INSERT 0 1")
+    conn.executemany = AsyncMock()
+    conn.fetch = AsyncMock(return_value=[])
+    conn.copy_records_to_table = AsyncMock()
+    
+    client.pool = MagicMock()
+    client.pool.acquire.return_value.__aenter__.return_value = conn
+    return conn
+
+
+def _placeholders(query):
+    """Bind parameter numbers used in a query, in order."""
+    return [int(n) for n in re.findall(r'\$(\d+)', query)]
+
+
+@pytest.mark.unit
+class TestQuoteIdent:
+    """Test identifier validation and quoting."""
+    
+    def test_quotes_schema_qualified_name(self):
+        """Test each part is quoted and lower-cased."""
+        assert _quote_ident("Public.Agents") == '"public"."agents"'
+    
+    @pytest.mark.parametrize("name", ["a; drop", 'a"b', "", "public.", "1abc"])
+    def test_rejects_non_identifiers(self, name):
+        """Test anything but a plain identifier is refused."""
+        with pytest.raises(ValueError, match="Invalid SQL identifier"):
+            _quote_ident(name)
+
+
+@pytest.mark.unit
+class TestWrites:
+    """Test the statements built for inserts and updates."""
+    
+    @pytest.mark.asyncio
+    async def test_insert_chunks_rows(self, client, connection):
+        """Test 2,500 rows go out as three statements numbered from $1."""
+        records = [{"id": i, "name": f"agent_{i}"} for i in range(2500)]
+        
+        await client.insert("agents", records)
+        
+        calls = connection.execute.call_args_list
+        assert len(calls) == 3
+        for call, rows in zip(calls, (1000, 1000, 500)):
+            query, *values = call.args
+            assert query.startswith('INSERT INTO "agents" ("id", "name") VALUES')
+            assert _placeholders(query) == list(range(1, rows * 2 + 1))
+            assert len(values) == rows * 2
+        assert calls[2].args[1:3] == (2000, "agent_2000")
+    
+    @pytest.mark.asyncio
+    async def test_insert_rejects_bad_column(self, client, connection):
+        """Test column names are validated before anything is sent."""
+        with pytest.raises(ValueError, match="Invalid SQL identifier"):
+            await client.insert("agents", {"a; drop": 1})
+        
+        connection.execute.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_insert_bulk_folds_names(self, client, connection):
+        """Test direct COPY gets the same folded names as the quoted SQL."""
+        await client.insert_bulk("Agents", ["ID", "Name"], [(1, "a")], schema="Public")
+        
+        copy = connection.copy_records_to_table.call_args
+        assert copy.args == ("agents",)
+        assert copy.kwargs["columns"] == ["id", "name"]
+        assert copy.kwargs["schema_name"] == "public"
+    
+    @pytest.mark.asyncio
+    async def test_copy_from_csv_folds_names(self, client, connection):
+        """Test CSV COPY splits the schema and folds every name."""
+        connection.copy_to_table = AsyncMock()
+        
+        await client.copy_from_csv("Public.Agents", "/tmp/agents.csv", columns=["ID"])
+        
+        copy = connection.copy_to_table.call_args
+        assert copy.args == ("agents",)
+        assert copy.kwargs["columns"] == ["id"]
+        assert copy.kwargs["schema_name"] == "public"
+    
+    @pytest.mark.asyncio
+    async def test_copy_rejects_bad_names(self, client, connection):
+        """Test COPY paths validate names like the SQL builders do."""
+        with pytest.raises(ValueError, match="Invalid SQL identifier"):
+            await client.insert_bulk("agents", ["a; drop"], [(1,)])
+        
+        connection.copy_records_to_table.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_insert_bulk_via_temp_table(self, client, connection):
+        """Test staged bulk inserts copy into a temp table and move the rows."""
+        connection.fetch.return_value = [{"id": 1}]
+        
+        result = await client.insert_bulk(
+            "agents", ["id", "name"], [(1, "a")],
+            via_temp_table=True, on_conflict="DO NOTHING", returning="id"
+        )
+        
+        assert result == [{"id": 1}]
+        create = connection.execute.call_args.args[0]
+        assert 'CREATE TEMP TABLE "_bulk_agents"' in create
+        copy = connection.copy_records_to_table.call_args
+        assert copy.args == ("_bulk_agents",)
+        assert copy.kwargs["columns"] == ["id", "name"]
+        assert connection.fetch.call_args.args[0] == (
+            'INSERT INTO "public"."agents" ("id", "name") '
+            'SELECT "id", "name" FROM "_bulk_agents" '
+            'ON CONFLICT DO NOTHING RETURNING id'
+        )
+    
+    @pytest.mark.asyncio
+    async def test_insert_bulk_requires_temp_table_for_returning(self, client, connection):
+        """Test COPY-only inserts refuse clauses COPY cannot express."""
+        with pytest.raises(ValueError):
+            await client.insert_bulk("agents", ["id"], [(1,)], returning="id")
+    
+    @pytest.mark.asyncio
+    async def test_update_many(self, client, connection):
+        """Test one UPDATE is executed for every parameter row."""
+        rows = [("active", 1), ("idle", 2)]
+        
+        await client.update_many("agents", ["status"], "id = $2", rows)
+        
+        connection.executemany.assert_awaited_once_with(
+            'UPDATE "agents" SET "status" = $1 WHERE id = $2',
+            rows,
+            timeout=client.command_timeout
+        )
+
+
+@pytest.mark.unit
+class TestReads:
+    """Test read helpers."""
+    
+    @pytest.mark.asyncio
+    async def test_fetch_many_keeps_query_order(self, client, connection):
+        """Test results come back in the order the queries were given."""
+        connection.fetch.side_effect = lambda query, *args, timeout=None: [(query, args)]
+        
+        results = await client.fetch_many([
+            ("SELECT 1", ()),
+            ("SELECT $1", (2,)),
+        ])
+        
+        assert results == [[("SELECT 1", ())], [("SELECT $1", (2,))]]
+
+
+@pytest.mark.unit
+class TestSchemaCache:
+    """Test caching of table metadata."""
+    
+    @pytest.mark.asyncio
+    async def test_missing_table_is_not_cached(self, client):
+        """Test a table created after a negative lookup is seen at once."""
+        with patch.object(client, 'fetchval', new=AsyncMock(side_effect=[False, True, True])) as fetchval:
+            assert await client.table_exists("agents") is False
+            assert await client.table_exists("agents") is True
+            assert await client.table_exists("agents") is True
+            
+            assert fetchval.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_columns_are_returned_as_copies(self, client):
+        """Test callers mutating the column list do not change the cache."""
+        rows = [("id", "integer", False, None)]
+        
+        with patch.object(client, 'fetch', new=AsyncMock(return_value=rows)) as fetch:
+            columns = await client.get_table_columns("agents")
+            columns[0]["name"] = "changed"
+            columns.append({})
+            
+            assert await client.get_table_columns("agents") == [
+                {"name": "id", "type": "integer", "nullable": False, "default": None}
+            ]
+            assert fetch.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_invalidate_schema_qualified_name(self, client):
+        """Test a schema-qualified name clears the cached entries."""
+        with patch.object(client, 'fetchval', new=AsyncMock(return_value=True)) as fetchval:
+            await client.table_exists("foo", schema="public")
+            client.invalidate_schema_cache("public.foo")
+            await client.table_exists("foo", schema="public")
+            
+            assert fetchval.call_count == 2
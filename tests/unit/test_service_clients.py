@@ -1,7 +1,7 @@
 """Unit tests for service client implementations."""
 
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from integration import (
     IndexAgentClient,
@@ -68,6 +68,60 @@ class TestIndexAgentClient:
                 params={"limit": 10, "offset": 0}
             )
     
+    @pytest.mark.asyncio
+    async def test_list_agents_projection(self, client):
+        """Test requesting a subset of agent fields."""
+        with patch.object(client, 'get') as mock_get:
+            mock_get.return_value = [{"id": "agent_1"}, {"id": "agent_2"}]
+            
+            result = await client.list_agents(fields=["id", "type"])
+            
+            assert result == [{"id": "agent_1"}, {"id": "agent_2"}]
+            mock_get.assert_called_once_with(
+                "/agents",
+                params={"fields": "id,type"}
+            )
+    
+    @pytest.mark.asyncio
+    async def test_aiter_agents(self, client):
+        """Test streamed agent listing goes through the public GET stream."""
+        async def items(*args, **kwargs):
+            for agent in ({"id": "agent_1"}, {"id": "agent_2"}):
+                yield agent
+        
+        with patch.object(client, '_request_iter', side_effect=items) as mock_iter:
+            result = [agent async for agent in client.aiter_agents(limit=2)]
+            
+            assert result == [{"id": "agent_1"}, {"id": "agent_2"}]
+            mock_iter.assert_called_once_with('GET', "/agents", "item", params={"limit": 2})
+    
+    @pytest.mark.asyncio
+    async def test_batched_agent_reads(self):
+        """Test concurrent get_agent calls share one bulk request."""
+        import asyncio
+        
+        client = IndexAgentClient("http://localhost:8081", batch_agent_reads=True)
+        
+        with patch.object(client, 'get') as mock_get:
+            mock_get.return_value = [
+                {"id": "agent_1", "name": "Agent 1"},
+                {"id": "agent_2", "name": "Agent 2"}
+            ]
+            
+            first, second = await asyncio.gather(
+                client.get_agent("agent_1"),
+                client.get_agent("agent_2")
+            )
+            
+            assert first["name"] == "Agent 1"
+            assert second["name"] == "Agent 2"
+            mock_get.assert_called_once_with(
+                "/agents",
+                params={"ids": "agent_1,agent_2"}
+            )
+        
+        await client.close()
+    
     @pytest.mark.asyncio
     async def test_error_handling(self, client):
         """Test error handling."""
@@ -80,6 +134,58 @@ class TestIndexAgentClient:
             
             with pytest.raises(ServiceTimeout):
                 await client.get("/test")
+    
+    @pytest.mark.asyncio
+    async def test_retries_only_transient_errors(self, client):
+        """Test 5xx responses are retried and 4xx responses are not."""
+        with patch.object(client, '_do_request') as mock_request, \
+                patch('integration.base.asyncio.sleep', new=AsyncMock()):
+            mock_request.side_effect = [
+                ServiceError("Unavailable", "IndexAgent", {"status_code": 503}),
+                {"status": "ok"}
+            ]
+            
+            assert await client.get("/test") == {"status": "ok"}
+            assert mock_request.call_count == 2
+            
+            mock_request.reset_mock()
+            mock_request.side_effect = ServiceError(
+                "Not found", "IndexAgent", {"status_code": 404}
+            )
+            
+            with pytest.raises(ServiceError):
+                await client.get("/test")
+            assert mock_request.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_not_modified_returns_fresh_object(self, client):
+        """Test mutating a GET result does not leak into later 304 reads."""
+        ok = MagicMock(status=200, content_type='application/json', headers={'ETag': '"v1"'})
+        ok.read = AsyncMock(return_value=b'{"agents": ["agent_1"]}')
+        not_modified = MagicMock(status=304)
+        session = MagicMock()
+        session.request.return_value.__aenter__.side_effect = [ok, not_modified, not_modified]
+        
+        with patch.object(client, '_get_session', new=AsyncMock(return_value=session)):
+            first = await client.get("/agents")
+            first["agents"].append("mutated")
+            second = await client.get("/agents")
+            second["agents"].clear()
+            
+            assert await client.get("/agents") == {"agents": ["agent_1"]}
+    
+    @pytest.mark.asyncio
+    async def test_post_is_not_retried(self, client):
+        """Test non-idempotent requests are sent once."""
+        with patch.object(client, '_do_request') as mock_request, \
+                patch('integration.base.asyncio.sleep', new=AsyncMock()):
+            mock_request.side_effect = ServiceTimeout(
+                "Request timeout", "IndexAgent", {"url": "/patterns/apply"}
+            )
+            
+            with pytest.raises(ServiceTimeout):
+                await client.post("/patterns/apply", json={})
+            assert mock_request.call_count == 1
 
 
 @pytest.mark.unit
@@ -133,13 +239,46 @@ class TestAirflowClient:
                 "/api/v1/dags/test_dag/dagRuns/test_run"
             )
     
+    def test_write_invalidates_only_related_reads(self, client):
+        """Test a write under /api/v1 keeps unrelated cached reads."""
+        for endpoint in (
+            "/api/v1/dags",
+            "/api/v1/dags/etl",
+            "/api/v1/dags/etl/dagRuns/run_1",
+            "/api/v1/dags/report",
+        ):
+            client._get_cache[(endpoint, ())] = ("etag", b"{}")
+        
+        client.invalidate_get_cache("/api/v1/dags/etl/dagRuns")
+        
+        assert sorted(key[0] for key in client._get_cache) == [
+            "/api/v1/dags",
+            "/api/v1/dags/report",
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_get_dag_is_cached_until_update(self, client):
+        """Test DAG definitions are cached and invalidated on update."""
+        with patch.object(client, 'get') as mock_get, \
+                patch.object(client, 'patch') as mock_patch:
+            mock_get.return_value = {"dag_id": "test_dag", "is_paused": False}
+            mock_patch.return_value = {"dag_id": "test_dag", "is_paused": True}
+            
+            await client.get_dag("test_dag")
+            await client.get_dag("test_dag")
+            assert mock_get.call_count == 1
+            
+            await client.update_dag("test_dag", is_paused=True)
+            await client.get_dag("test_dag")
+            assert mock_get.call_count == 2
+    
     @pytest.mark.asyncio
     async def test_basic_auth_header(self, client):
         """Test basic auth header is set."""
         import base64
         
-        auth_header = client._session.headers.get('Authorization')
-        assert auth_header is not None
+        assert client.auth is not None
+        auth_header = client.auth.encode()
         assert auth_header.startswith('Basic ')
         
         # Decode and verify
@@ -204,10 +343,67 @@ class TestEvolutionAPIClient:
         """Test getting metrics in Prometheus format."""
         prometheus_metrics = "evolution_fitness_best 0.92\n"
         
-        with patch.object(client, '_request') as mock_request:
-            mock_request.return_value = prometheus_metrics
-            
+        response = MagicMock(status=200)
+        response.text = AsyncMock(return_value=prometheus_metrics)
+        session = MagicMock()
+        session.get.return_value.__aenter__.return_value = response
+        
+        with patch.object(client, '_get_session', new=AsyncMock(return_value=session)):
             result = await client.get_metrics(format="prometheus")
             
             assert "evolution_fitness_best" in result
-            mock_request.assert_called_once()
\ No newline at end of file
+            session.get.assert_called_once()
+
+@pytest.mark.unit
+class TestRedisCacheClient:
+    """Test RedisCacheClient behaviour that needs no server."""
+    
+    @pytest.fixture
+    def client(self):
+        """Create Redis cache client."""
+        from integration.redis_cache_client import RedisCacheClient
+        return RedisCacheClient()
+    
+    def test_int_keyed_dict_round_trip(self, client):
+        """Test dicts with non-string keys decode as written."""
+        from integration.redis_cache_client import _serialize
+        
+        value = {1: "one", 2: [1, 2]}
+        
+        assert client._decode(_serialize(value)) == value
+    
+    def test_raw_bytes_with_magic_prefix(self, client):
+        """Test raw values starting with the MessagePack prefix are returned unchanged."""
+        from integration.redis_cache_client import _MSGPACK_MAGIC
+        
+        value = _MSGPACK_MAGIC + b"\x01\x02\x03\x04"
+        
+        assert client._decode(value) == value
+    
+    @pytest.mark.asyncio
+    async def test_requires_connect(self, client):
+        """Test operations before connect() fail with a clear error."""
+        with pytest.raises(RuntimeError, match="not connected"):
+            await client.get("key")
+    
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_messages(self, client):
+        """Test queued messages survive a failed publish pipeline."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(side_effect=[ConnectionError("reset"), [1, 1]])
+        client.redis = MagicMock()
+        client.redis.pipeline.return_value = pipe
+        client._pub_buffer = [("events", "first"), ("events", "second")]
+        
+        with pytest.raises(ConnectionError):
+            await client.flush_publish()
+        assert client._pub_buffer == [("events", "first"), ("events", "second")]
+        
+        pipe.publish.reset_mock()
+        await client.flush_publish()
+        
+        assert client._pub_buffer == []
+        assert [c.args for c in pipe.publish.call_args_list] == [
+            ("events", "first"),
+            ("events", "second"),
+        ]